@@ -3,12 +3,16 @@ app package
 -----------
 Ne contient plus d’import direct sur navbar : tout est
 re-exporté proprement par app.components.
-"""
 
-# expose seulement les sous-packages utiles
+Aucun import à l’ouverture du paquet : les sous-paquets (components,
+data) ne sont chargés qu’au premier accès (démarrage à froid plus court).
+"""
 from importlib import import_module
 
-# Charge dynamiquement app.components pour éviter les import loops
-import_module("app.components")
+__all__: list[str] = ["components", "data"]
+
 
-__all__: list[str] = ["components"]
+def __getattr__(name: str):
+    if name in __all__:
+        return import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
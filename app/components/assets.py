@@ -0,0 +1,204 @@
+"""
+Asset cache – images encodées une seule fois par process
+--------------------------------------------------------
+• data URI base64 mis en cache, clé = (chemin, mtime)
+• éviction LRU sous un budget d’octets (CCF_ASSET_CACHE_MB, 64 Mo par défaut)
+• partagé par toutes les sessions Streamlit du process (thread-safe)
+• image_src() choisit la variante redimensionnée (`make assets`) adaptée
+  à la taille d’affichage, sinon l’original
+• CCF_ASSET_MODE=url : au lieu d’un data URI, URL servie par le static
+  serving de Streamlit (app/static/…) avec un nom de fichier haché,
+  donc cacheable indéfiniment ; les copies hachées sont produites par
+  `make assets`, à défaut → data URI
+• l’en-tête `Cache-Control: immutable` de ces URL est posé par nginx
+  (deploy/nginx.conf) : un `streamlit run` seul n’envoie aucun
+  Cache-Control. Le mode url n’est donc activé que derrière ce proxy
+  (deploy/workers.py, `make run WORKERS=n`) ; par défaut → data URI
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import mimetypes
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+ASSETS_DIR = ROOT / "app/static/assets"
+GENERATED_DIR = ASSETS_DIR / "generated"
+MANIFEST = GENERATED_DIR / "manifest.json"
+HASHED_DIR = ASSETS_DIR / "hashed"
+STATIC_DIR = ROOT / "app/static"          # servi sous /app/static/ par Streamlit
+
+BUDGET_BYTES = int(float(os.environ.get("CCF_ASSET_CACHE_MB", 64)) * 1024 ** 2)
+DPR = 2                     # densité visée (écrans « retina »)
+FORMATS = tuple(os.environ.get("CCF_IMAGE_FORMATS", "webp").split(","))
+ASSET_MODE = os.environ.get("CCF_ASSET_MODE", "inline")    # inline | url (nginx)
+
+# mimetypes ignore .webp sur certaines plateformes et renvoie « jpg » nulle part
+_MIME = {".jpg": "image/jpeg", ".jpeg": "image/jpeg", ".png": "image/png",
+         ".webp": "image/webp", ".avif": "image/avif", ".svg": "image/svg+xml"}
+
+
+def mime_type(path: Path) -> str:
+    return (_MIME.get(path.suffix.lower())
+            or mimetypes.guess_type(path.name)[0]
+            or "application/octet-stream")
+
+
+class _LRUCache:
+    """OrderedDict LRU borné en octets (taille = longueur des valeurs)."""
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.size = 0
+        self.hits = self.misses = 0
+        self._data: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> str | None:
+        with self._lock:
+            value = self._data.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: tuple, value: str) -> None:
+        with self._lock:
+            old = self._data.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            # une entrée plus grosse que le budget n’est jamais gardée
+            if len(value) > self.budget:
+                return
+            self._data[key] = value
+            self.size += len(value)
+            while self.size > self.budget:
+                _, evicted = self._data.popitem(last=False)
+                self.size -= len(evicted)
+
+    def discard(self, path: str) -> None:
+        """Retire les anciennes versions (mtime périmé) d’un même fichier."""
+        with self._lock:
+            for key in [k for k in self._data if k[0] == path]:
+                self.size -= len(self._data.pop(key))
+
+    def stats(self) -> dict[str, int]:
+        return dict(entries=len(self._data), bytes=self.size,
+                    hits=self.hits, misses=self.misses)
+
+
+_CACHE = _LRUCache(BUDGET_BYTES)
+
+
+def data_uri(path: str | Path) -> str | None:
+    """`data:<mime>;base64,…` pour *path*, ou None si le fichier n’existe pas."""
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = (str(path), mtime)
+    uri = _CACHE.get(key)
+    if uri is None:
+        _CACHE.discard(str(path))
+        uri = (f"data:{mime_type(path)};base64,"
+               + base64.b64encode(path.read_bytes()).decode())
+        _CACHE.put(key, uri)
+    return uri
+
+
+def cache_stats() -> dict[str, int]:
+    return _CACHE.stats()
+
+
+# ─────────────────── variantes redimensionnées ────────────────────────
+_manifest: tuple[int, dict] = (0, {})
+
+
+def _sources() -> dict:
+    global _manifest
+    try:
+        mtime = MANIFEST.stat().st_mtime_ns
+    except OSError:
+        return {}
+    if _manifest[0] != mtime:
+        _manifest = (mtime, json.loads(MANIFEST.read_text()).get("sources", {}))
+    return _manifest[1]
+
+
+def variant(path: str | Path, width: int | None = None,
+            height: int | None = None) -> Path:
+    """Plus petite variante couvrant width×height (px CSS × DPR), sinon *path*.
+
+    Une variante qui n’est pas plus légère que l’original (PNG/JPEG déjà
+    bien compressé, petit logo) est ignorée : l’original est servi.
+    """
+    path = Path(path)
+    try:
+        rel = path.resolve().relative_to(ASSETS_DIR).as_posix()
+        size = path.stat().st_size
+    except (ValueError, OSError):
+        return path
+    entry = _sources().get(rel)
+    if not entry or (width is None and height is None):
+        return path
+    fits = [v for v in entry["variants"]
+            if v["format"] in FORMATS and v["bytes"] < size
+            and v["width"] >= (width or 0) * DPR
+            and v["height"] >= (height or 0) * DPR]
+    if not fits:
+        return path
+    best = min(fits, key=lambda v: (v["bytes"], FORMATS.index(v["format"])))
+    fp = ASSETS_DIR / best["path"]
+    return fp if fp.exists() else path
+
+
+# ─────────────────── mode URL (static serving) ────────────────────────
+_digests: dict[tuple[str, int], str] = {}
+
+
+def hashed_name(path: Path, digest: str) -> str:
+    """Nom de la copie hachée de *path* (sha256 *digest*) dans HASHED_DIR."""
+    return f"{path.stem.replace(' ', '_')}.{digest[:12]}{path.suffix.lower()}"
+
+
+def static_url(path: str | Path) -> str | None:
+    """URL relative `app/static/assets/hashed/<nom>.<sha12><ext>` de *path*.
+
+    Les copies hachées sont écrites par `make assets` ; ici on ne fait que
+    les chercher (aucune écriture pendant une requête). None si la copie
+    manque : source ajoutée ou modifiée depuis le dernier `make assets`.
+    """
+    path = Path(path)
+    try:
+        mtime = path.stat().st_mtime_ns
+    except OSError:
+        return None
+    key = (str(path), mtime)
+    digest = _digests.get(key)
+    if digest is None:
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        _digests[key] = digest
+    dst = HASHED_DIR / hashed_name(path, digest)
+    if not dst.exists():
+        return None
+    return "app/static/" + dst.relative_to(STATIC_DIR).as_posix()
+
+
+def image_src(path: str | Path, width: int | None = None,
+              height: int | None = None) -> str | None:
+    """`src` d’une balise <img> pour un affichage de width×height px CSS.
+
+    Mode url : l’URL hachée, sinon (copie absente) le data URI.
+    """
+    fp = variant(path, width, height)
+    if ASSET_MODE == "url":
+        return static_url(fp) or data_uri(fp)
+    return data_uri(fp)
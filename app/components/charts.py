@@ -0,0 +1,127 @@
+"""
+ECharts – composant bidirectionnel des pages Database et Analysis
+----------------------------------------------------------------
+• un composant Streamlit (app/components/echarts/frontend, JS sans build)
+  garde son iframe et son instance ECharts d’un rerun à l’autre : changer
+  de vue = setOption() sur le graphique existant, pas de nouvelle iframe
+• séries numériques envoyées en octets (float32 NumPy → Float32Array
+  côté navigateur, arguments bytes du protocole des composants) ; axe
+  temporel compact : début + pas en mois (ou mois en int32 si la série
+  a été réduite par LTTB), libellés recalculés dans le navigateur
+• payload calculé une fois par (vue, version des données), en mémoire
+  (LRU de CACHE_ENTRIES payloads) puis dans app.data.cache (disque,
+  partagé entre workers)
+• retour : dernier clic {id, name, series, index} ou None
+• ECharts 5.5.1 épinglé, versionné dans le dossier du composant
+  (dist officiel minifié ; `make echarts` le remplace par un bundle
+  réduit) ; jamais de CDN : sans bundle, message d’erreur + tableau
+"""
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.components.v1 import declare_component
+
+from app.data import cache
+
+ROOT = Path(__file__).resolve().parents[2]
+FRONTEND_DIR = ROOT / "app/components/echarts/frontend"
+BUNDLE = FRONTEND_DIR / "echarts-5.5.1.min.js"     # même nom que dans main.js
+
+_component = declare_component("ccf_echarts", path=str(FRONTEND_DIR))
+
+VIEWS = ("media", "time", "compare", "stacked", "share")
+_Y_NAME = {"share": "Share of coverage (%)"}
+
+CACHE_ENTRIES = 32
+
+_CACHE: OrderedDict[tuple, tuple[dict, dict]] = OrderedDict()
+_LOCK = threading.Lock()
+_STATS = dict(hits=0, misses=0)
+
+
+def data_version(df: pd.DataFrame) -> str:
+    version = df.attrs.get("version")
+    if version is None:
+        version = f"h{pd.util.hash_pandas_object(df, index=False).sum():x}"
+        df.attrs["version"] = version
+    return version
+
+
+def _floats(values) -> bytes:
+    return np.ascontiguousarray(values, dtype="<f4").tobytes()
+
+
+def _axis(df: pd.DataFrame) -> tuple[dict, dict]:
+    """Axe temporel : {start, step, n} si régulier, sinon mois en int32."""
+    months = df["year_month"].to_numpy().astype("datetime64[M]").astype(np.int64)
+    axis = dict(granularity=df.attrs.get("granularity", "month"), n=len(months))
+    steps = np.diff(months)
+    if len(months) and (len(steps) == 0 or (steps == steps[0]).all()):
+        axis.update(start=int(months[0]), step=int(steps[0]) if len(steps) else 1)
+        return axis, {}
+    return axis, {"x": months.astype("<i4").tobytes()}
+
+
+def encode(view: str, df: pd.DataFrame) -> tuple[dict, dict]:
+    """(arguments JSON, arguments bytes) du composant pour *view*."""
+    if view not in VIEWS:
+        raise ValueError(f"view must be one of {VIEWS}")
+    args: dict = dict(view=view, y_name=_Y_NAME.get(view, "Articles"))
+    if view == "media":
+        args.update(kind="bar", categories=df["media"].tolist(), names=["Articles"])
+        return args, {"s0": _floats(df["n_articles"])}
+    axis, buffers = _axis(df)
+    if view == "time":
+        names, cols = ["Articles"], ["n_articles"]
+    else:
+        cols = [c for c in df.columns if c not in ("year_month", "label")]
+        names = cols
+    args.update(kind="line", axis=axis, names=names, stack=view == "stacked")
+    buffers.update({f"s{i}": _floats(df[c]) for i, c in enumerate(cols)})
+    return args, buffers
+
+
+def payload(view: str, df: pd.DataFrame) -> tuple[dict, dict]:
+    key = (view, data_version(df))
+    with _LOCK:
+        hit = _CACHE.get(key)
+        if hit is not None:
+            _CACHE.move_to_end(key)
+            _STATS["hits"] += 1
+            return hit
+    _STATS["misses"] += 1
+    disk_key = cache.key("echarts", key, cache.code_version(__file__))
+    hit = cache.get(disk_key)
+    if hit is cache.MISS:
+        hit = encode(view, df)
+        cache.put(disk_key, hit)
+    with _LOCK:
+        _CACHE[key] = hit
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > CACHE_ENTRIES:
+            _CACHE.popitem(last=False)
+    return hit
+
+
+def echarts_chart(view: str, df: pd.DataFrame, *, key: str, axes_wait: int,
+                  step_ms: int, height: int = 520) -> dict | None:
+    """Affiche / met à jour le graphique *key* ; renvoie le dernier clic."""
+    if not BUNDLE.exists():                       # pas de repli CDN : tableau
+        st.error(f"Chart unavailable: {BUNDLE.relative_to(ROOT)} is missing "
+                 "(restore it from git or run `make echarts`).")
+        st.dataframe(df, hide_index=True)
+        return None
+    args, buffers = payload(view, df)
+    return _component(**args, **buffers, version=f"{view}|{data_version(df)}",
+                      anim=dict(axes_wait=axes_wait, step_ms=step_ms),
+                      height=height, key=key, default=None)
+
+
+def cache_stats() -> dict[str, int]:
+    return dict(entries=len(_CACHE), **_STATS)
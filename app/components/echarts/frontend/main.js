@@ -0,0 +1,125 @@
+// Composant ECharts (app.components.charts) – protocole des composants
+// Streamlit en postMessage, sans build ni dépendance.
+// • une instance ECharts pour toute la vie de l’iframe : chaque rendu
+//   Streamlit fait un setOption() sur le graphique existant
+// • séries reçues en octets (float32) → Float32Array ; axe temporel
+//   {start, step, n} ou mois int32 (« x »), libellés recalculés ici
+// • un clic renvoie {id, name, series, index} à Python
+"use strict";
+
+const BUNDLE = "echarts-5.5.1.min.js";            // versionné (dist officiel) ; `make echarts` : bundle réduit
+
+function send(type, data) {
+  window.parent.postMessage(Object.assign({ isStreamlitMessage: true, type }, data), "*");
+}
+
+function loadScript(src) {
+  return new Promise((resolve, reject) => {
+    const s = document.createElement("script");
+    s.src = src;
+    s.onload = resolve;
+    s.onerror = reject;
+    document.head.appendChild(s);
+  });
+}
+
+// pas de repli CDN : un déploiement hors ligne doit échouer visiblement
+const ready = loadScript(BUNDLE).catch(() => {
+  const msg = `ccf_echarts: ${BUNDLE} is missing – run \`make echarts\``;
+  document.getElementById("eplot").textContent = msg;
+  send("streamlit:setFrameHeight", { height: 40 });
+  throw new Error(msg);
+});
+
+// ── décodage ─────────────────────────────────────────────────────────
+// les Uint8Array reçus ne sont pas forcément alignés : slice() = copie alignée
+const f32 = (u8) => new Float32Array(u8.slice().buffer);
+const i32 = (u8) => new Int32Array(u8.slice().buffer);
+const values = (arr) => Array.from(arr, (v) => (Number.isNaN(v) ? null : v));
+
+function labels(axis, x) {
+  const out = new Array(axis.n);
+  for (let i = 0; i < axis.n; i++) {
+    const k = x ? x[i] : axis.start + i * axis.step;   // mois depuis 1970-01
+    const y = Math.floor(k / 12) + 1970, m = (k % 12) + 1;
+    out[i] = axis.granularity === "year" ? `${y}`
+      : axis.granularity === "quarter" ? `${y} Q${Math.floor((m - 1) / 3) + 1}`
+      : `${y}‑${String(m).padStart(2, "0")}`;
+  }
+  return out;
+}
+
+// ── options (mêmes styles que les anciennes iframes) ─────────────────
+function option(a, series) {
+  const delay = (i) => a.anim.axes_wait + a.anim.step_ms * i;
+  const base = {
+    tooltip: { trigger: "axis" },
+    yAxis: { type: "value", name: a.y_name },
+    animationDurationUpdate: 500,
+  };
+  if (a.kind === "bar") {
+    return Object.assign(base, {
+      legend: { show: false },
+      grid: { top: 60 },
+      xAxis: { type: "category", data: a.categories, axisLabel: { rotate: 35 } },
+      series: [{
+        type: "bar", data: series[0],
+        itemStyle: { color: { type: "linear", x: 0, y: 0, x2: 0, y2: 1,
+          colorStops: [{ offset: 0, color: "#f0f1f2" }, { offset: 1, color: "#41626a" }] } },
+        animationDelay: delay, animationDuration: a.anim.step_ms,
+      }],
+    });
+  }
+  const multi = a.names.length > 1 || a.view !== "time";
+  return Object.assign(base, {
+    legend: { show: multi, type: "scroll", top: 0 },
+    grid: { top: multi ? 48 : 60 },
+    xAxis: { type: "category", data: a.labels, axisLabel: { rotate: 0 } },
+    series: series.map((data, i) => multi ? {
+      type: "line", name: a.names[i], data, smooth: true, showSymbol: false,
+      stack: a.stack ? "total" : null, areaStyle: a.stack ? { opacity: 0.35 } : null,
+      animationDelay: delay, animationDuration: a.anim.step_ms,
+    } : {
+      type: "line", name: a.names[i], data, smooth: true, symbol: "circle",
+      lineStyle: { width: 3, color: "#41626a" },
+      areaStyle: { color: "rgba(65,98,106,0.15)" },
+      animationDelay: delay, animationDuration: a.anim.step_ms,
+    }),
+  });
+}
+
+// ── rendu ────────────────────────────────────────────────────────────
+let chart = null;
+let version = null;
+
+function render(a) {
+  if (!chart) {
+    const el = document.getElementById("eplot");
+    el.style.height = `${a.height}px`;
+    chart = echarts.init(el, null, { renderer: "svg" });
+    chart.on("click", (p) => send("streamlit:setComponentValue", {
+      value: { id: Date.now(), name: p.name, series: p.seriesName ?? null,
+               index: p.dataIndex },
+      dataType: "json",
+    }));
+    window.addEventListener("resize", () => chart.resize());
+    send("streamlit:setFrameHeight", { height: a.height + 16 });
+  }
+  if (a.version === version) return;              // rerun sans changement
+  version = a.version;
+
+  const t0 = performance.now();
+  const series = a.names.map((_, i) => values(f32(a[`s${i}`])));
+  if (a.kind === "line") a.labels = labels(a.axis, a.x ? i32(a.x) : null);
+  // remplace séries, axes et légende ; l’instance (et le SVG) restent
+  chart.setOption(option(a, series), { replaceMerge: ["series", "xAxis", "yAxis"] });
+  console.debug(`ccf_echarts ${a.view}: decode + setOption ${(performance.now() - t0).toFixed(1)} ms`);
+}
+
+window.addEventListener("message", (event) => {
+  if (event.data.type !== "streamlit:render") return;
+  const args = event.data.args;
+  ready.then(() => render(args));
+});
+
+send("streamlit:componentReady", { apiVersion: 1 });
@@ -0,0 +1,168 @@
+"""
+Profiling – temps, octets envoyés et caches par rerun
+-----------------------------------------------------
+• CCF_PROFILE=1 pour l’activer ; sinon section()/profiled() ne font rien
+• begin(page) … end() encadrent un rerun ; fragment(nom) encadre le
+  corps d’un @st.fragment (un rerun à lui seul quand il est relancé
+  seul, une simple section sinon) ; section(nom) / @profiled
+  mesurent un bloc : durée, octets des ForwardMsg envoyés au navigateur,
+  hits / misses des caches (compteurs process : approximatifs si plusieurs
+  sessions tournent en même temps)
+• end() affiche un panneau de debug et ajoute une ligne JSON à
+  CCF_PROFILE_LOG (data/processed/profile.jsonl par défaut)
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Callable, Iterator
+
+ROOT = Path(__file__).resolve().parents[2]
+ENABLED = os.environ.get("CCF_PROFILE", "") not in ("", "0")
+LOG_FILE = Path(os.environ.get("CCF_PROFILE_LOG", ROOT / "data/processed/profile.jsonl"))
+
+# modules exposant cache_stats() -> {"hits": …, "misses": …}
+CACHES = {
+    "assets": "app.components.assets",
+    "charts": "app.components.charts",
+    "styles": "app.components.styles",
+    "loaders": "app.data.loaders",
+    "artifacts": "app.data.cache",
+}
+
+_local = threading.local()             # un thread de script par session
+_log_lock = threading.Lock()
+
+
+class _Rerun:
+    def __init__(self, page: str) -> None:
+        self.page = page
+        self.t0 = time.perf_counter()
+        self.bytes = 0
+        self.sections: list[dict] = []
+        self.open: list[dict] = []      # sections imbriquées en cours
+
+
+def _caches() -> dict[str, tuple[int, int]]:
+    out = {}
+    for name, module in CACHES.items():
+        mod = sys.modules.get(module)
+        if mod is not None:
+            s = mod.cache_stats()
+            out[name] = (s["hits"], s["misses"])
+    return out
+
+
+def _hook_enqueue(rerun: _Rerun) -> None:
+    """Compte la taille de chaque message envoyé par la session courante."""
+    try:
+        from streamlit.runtime.scriptrunner import get_script_run_ctx
+        ctx = get_script_run_ctx()
+        original = ctx.enqueue
+    except Exception:                  # hors Streamlit ou API interne changée
+        return
+    original = getattr(original, "__wrapped__", original)
+
+    @wraps(original)
+    def enqueue(msg):
+        current = getattr(_local, "rerun", None)
+        if current is not None:
+            size = msg.ByteSize()
+            current.bytes += size
+            for sec in current.open:
+                sec["bytes"] += size
+        return original(msg)
+
+    ctx.enqueue = enqueue
+
+
+def begin(page: str) -> None:
+    if not ENABLED:
+        return
+    _local.rerun = _Rerun(page)
+    _hook_enqueue(_local.rerun)
+
+
+@contextmanager
+def section(name: str) -> Iterator[None]:
+    rerun = getattr(_local, "rerun", None) if ENABLED else None
+    if rerun is None:
+        yield
+        return
+    t0 = time.perf_counter()
+    sec = dict(name=name, depth=len(rerun.open),
+               at=round((t0 - rerun.t0) * 1e3, 2), bytes=0)
+    before = _caches()
+    rerun.open.append(sec)
+    try:
+        yield
+    finally:
+        sec["ms"] = round((time.perf_counter() - t0) * 1e3, 2)
+        rerun.open.pop()
+        after = _caches()
+        for cache, (hits, misses) in after.items():
+            h0, m0 = before.get(cache, (0, 0))
+            if hits - h0 or misses - m0:
+                sec[f"{cache}_hit"] = hits - h0
+                sec[f"{cache}_miss"] = misses - m0
+        rerun.sections.append(sec)
+
+
+def profiled(name: str | None = None) -> Callable:
+    """Décorateur : le corps de la fonction devient une section."""
+    def deco(fn: Callable) -> Callable:
+        label = name or fn.__name__
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with section(label):
+                return fn(*args, **kwargs)
+        return wrapper
+    return deco
+
+
+@contextmanager
+def fragment(name: str) -> Iterator[None]:
+    """Section pendant un rerun complet ; rerun à part entière sinon.
+
+    S’utilise aussi en décorateur, sous @st.fragment.
+    """
+    if not ENABLED or getattr(_local, "rerun", None) is not None:
+        with section(name):
+            yield
+        return
+    begin(name)
+    try:
+        yield
+    finally:
+        end()
+
+
+def end() -> None:
+    rerun = getattr(_local, "rerun", None) if ENABLED else None
+    if rerun is None:
+        return
+    _local.rerun = None
+    record = dict(ts=time.time(), page=rerun.page,
+                  ms=round((time.perf_counter() - rerun.t0) * 1e3, 2),
+                  bytes=rerun.bytes,
+                  sections=sorted(rerun.sections, key=lambda s: s["at"]))
+    with _log_lock:
+        LOG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        with LOG_FILE.open("a") as fh:
+            fh.write(json.dumps(record) + "\n")
+
+    import streamlit as st
+    with st.expander(f"⏱ {rerun.page}: {record['ms']} ms · "
+                     f"{record['bytes'] / 1024:.0f} KiB"):
+        st.table([{"section": "· " * s["depth"] + s["name"]}
+                  | {k: v for k, v in s.items() if k not in ("name", "depth")}
+                  for s in record["sections"]])
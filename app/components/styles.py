@@ -0,0 +1,78 @@
+"""
+Styles – un seul bloc <style> par page, minifié et mis en cache
+--------------------------------------------------------------
+• PAGES : fichiers de app/static/css concaténés pour chaque page
+  (chrome.css = sidebar masquée, navbar.css = barre fixe, …)
+• bundle() : concatène + minifie une fois par process ; la clé contient
+  les mtimes → un fichier modifié est relu au rerun suivant, sinon aucun
+  accès disque
+• inject() : émet le bundle avec un id = empreinte du contenu
+  (<style id="ccf-<sha>">) ; Streamlit retire les éléments non ré-émis,
+  le bundle est donc renvoyé à chaque rerun complet, depuis la mémoire
+"""
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from pathlib import Path
+
+import streamlit as st
+
+from app.components.profiling import profiled
+
+ROOT = Path(__file__).resolve().parents[2]
+CSS_DIR = ROOT / "app/static/css"
+
+PAGES: dict[str, tuple[str, ...]] = {
+    "chrome": ("chrome.css",),
+    "Home": ("chrome.css", "home.css"),
+    "Database": ("chrome.css", "home.css", "navbar.css", "database.css"),
+}
+DEFAULT = ("chrome.css", "home.css", "navbar.css")
+
+_COMMENTS = re.compile(r"/\*.*?\*/", re.S)
+_SPACES = re.compile(r"\s+")
+_PUNCT = re.compile(r"\s*([{};,>])\s*")
+
+_CACHE: dict[tuple, tuple[str, str]] = {}
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def minify(css: str) -> str:
+    """Retire commentaires et blancs inutiles (« : » et « + » intacts)."""
+    css = _SPACES.sub(" ", _COMMENTS.sub("", css))
+    return _PUNCT.sub(r"\1", css).replace(";}", "}").strip()
+
+
+def _files(page: str) -> list[Path]:
+    return [CSS_DIR / name for name in PAGES.get(page, DEFAULT)]
+
+
+def bundle(page: str, extra: str = "") -> tuple[str, str]:
+    """(empreinte, CSS minifié) des fichiers de *page* suivis de *extra*."""
+    files = [fp for fp in _files(page) if fp.exists()]
+    key = (page, extra, tuple((fp.name, fp.stat().st_mtime_ns) for fp in files))
+    hit = _CACHE.get(key)
+    if hit is not None:
+        _stats["hits"] += 1
+        return hit
+    _stats["misses"] += 1
+    css = minify("\n".join([fp.read_text() for fp in files] + [extra]))
+    out = (hashlib.sha1(css.encode()).hexdigest()[:12], css)
+    with _lock:
+        for k in [k for k in _CACHE if k[:2] == key[:2]]:   # ancienne version
+            del _CACHE[k]
+        _CACHE[key] = out
+    return out
+
+
+@profiled("css")
+def inject(page: str, extra: str = "") -> None:
+    digest, css = bundle(page, extra)
+    st.markdown(f'<style id="ccf-{digest}">{css}</style>', unsafe_allow_html=True)
+
+
+def cache_stats() -> dict[str, int]:
+    return dict(_stats, entries=len(_CACHE))
@@ -0,0 +1,5 @@
+"""
+app.data
+--------
+Couche données des pages : chargeurs mémoïsés des agrégats du corpus.
+"""
@@ -0,0 +1,201 @@
+"""
+Analysis – parts de couverture par cadre / sujet, média, région et mois
+----------------------------------------------------------------------
+• sorties de modèle par article (probabilité de chaque cadre ou sujet)
+  rangées en matrice float32 (scores.npy, `make analysis`), lignes
+  triées par (média, mois)
+• offsets.npy : début de chaque cellule média × mois dans scores.npy
+  → une cellule = une plage contiguë de lignes
+• scores, offsets et dims.json publiés ensemble dans
+  data/processed/analysis/<version>/ (app.data.snapshot)
+• chargé en mmap (pages partagées entre workers), re-chargé seulement
+  quand une nouvelle version est publiée
+• une seule réduction groupée sur tous les articles (np.add.reduceat),
+  faite au premier appel ; toute tranche ensuite = indexation + sommes
+  sur (média, mois, cadre), quelques ms
+• part de couverture = Σ probabilités / nombre d’articles (en %)
+"""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.data import snapshot
+from app.data.resample import GRANULARITIES
+
+ROOT = Path(__file__).resolve().parents[2]
+ANALYSIS_DIR = ROOT / "data/processed/analysis"
+
+GROUPINGS = ("label", "outlet", "region")
+
+# région de diffusion de chaque média (les quotidiens nationaux à part)
+REGIONS = {
+    "Globe and Mail": "National", "National Post": "National",
+    "Toronto Star": "Ontario", "Toronto Sun": "Ontario", "Le Droit": "Ontario",
+    "Le Devoir": "Quebec", "La Presse": "Quebec", "La Presse Plus": "Quebec",
+    "Montreal Gazette": "Quebec", "Journal de Montreal": "Quebec",
+    "Calgary Herald": "Prairies", "Edmonton Journal": "Prairies",
+    "Winnipeg Free Press": "Prairies", "Star Phoenix": "Prairies",
+    "Vancouver Sun": "British Columbia", "Times Colonist": "British Columbia",
+    "Chronicle Herald": "Atlantic", "The Telegram": "Atlantic",
+    "Acadie Nouvelle": "Atlantic",
+    "Whitehorse Daily Star": "North",
+}
+
+
+def _period_starts(months: np.ndarray, granularity: str) -> np.ndarray:
+    """Indices (sur l’axe des mois) où commence chaque période."""
+    if granularity == "quarter":
+        key = months // 3
+    elif granularity == "year":
+        key = months // 12
+    elif granularity == "month":
+        return np.arange(len(months))
+    else:
+        raise ValueError(f"granularity must be one of {GRANULARITIES}")
+    return np.flatnonzero(np.r_[True, key[1:] != key[:-1]])
+
+
+def _labels(months: np.ndarray, granularity: str) -> list[str]:
+    y, m = months // 12 + 1970, months % 12 + 1
+    if granularity == "month":
+        return [f"{a}‑{b:02d}" for a, b in zip(y, m)]
+    if granularity == "quarter":
+        return [f"{a} Q{(b - 1) // 3 + 1}" for a, b in zip(y, m)]
+    return [str(a) for a in y]
+
+
+class Scores:
+    def __init__(self, scores: np.ndarray, offsets: np.ndarray, dims: dict,
+                 version: str) -> None:
+        self.scores = scores                      # (article, label) float32
+        self.offsets = offsets                    # (outlet × month + 1,)
+        self.labels: list[str] = dims["labels"]
+        self.outlets: list[str] = dims["outlets"]
+        self.first_month: int = dims["first_month"]   # mois depuis 1970-01
+        self.n_months: int = dims["n_months"]
+        self.version = version
+        self.regions = sorted({REGIONS.get(o, "Other") for o in self.outlets})
+        self._outlet_idx = {o: i for i, o in enumerate(self.outlets)}
+        self._label_idx = {lab: i for i, lab in enumerate(self.labels)}
+        self._region_of = np.array(
+            [self.regions.index(REGIONS.get(o, "Other")) for o in self.outlets])
+        self._cells: tuple[np.ndarray, np.ndarray] | None = None
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    def cells(self) -> tuple[np.ndarray, np.ndarray]:
+        """(Σ probabilités (média, mois, cadre), nombre d’articles (média, mois))."""
+        if self._cells is None:
+            with self._lock:
+                if self._cells is None:
+                    shape = (len(self.outlets), self.n_months)
+                    counts = np.diff(self.offsets)
+                    full = np.flatnonzero(counts)
+                    sums = np.zeros((counts.size, len(self.labels)))
+                    if full.size:
+                        sums[full] = np.add.reduceat(
+                            self.scores, self.offsets[full], axis=0, dtype=np.float64)
+                    self._cells = (sums.reshape(*shape, -1), counts.reshape(shape))
+        return self._cells
+
+    def frame(self, by: str = "outlet", label: str | None = None,
+              outlets: Sequence[str] | None = None,
+              years: tuple[int, int] | None = None,
+              granularity: str = "year") -> pd.DataFrame:
+        """Part de couverture (%) par période, une colonne par groupe.
+
+        by="label"  : une colonne par cadre, médias *outlets* confondus
+        by="outlet" : une colonne par média, pour le cadre *label*
+        by="region" : une colonne par région, pour le cadre *label*
+        Format year_month / label / colonnes de valeurs (app.components.charts) ;
+        attrs : version, granularity.
+        """
+        if by not in GROUPINGS:
+            raise ValueError(f"by must be one of {GROUPINGS}")
+        sums, counts = self.cells()
+        o = (np.array([self._outlet_idx[n] for n in outlets], dtype=np.intp)
+             if outlets else np.arange(len(self.outlets)))
+        months = self.first_month + np.arange(self.n_months)
+        lo, hi = 0, self.n_months
+        if years:
+            lo = int(np.searchsorted(months, (years[0] - 1970) * 12))
+            hi = int(np.searchsorted(months, (years[1] - 1970 + 1) * 12))
+        months = months[lo:hi]
+        sums, counts = sums[o, lo:hi], counts[o, lo:hi]
+
+        if by == "label":
+            names = self.labels
+            num = sums.sum(axis=0).T                 # (cadre, mois)
+            den = np.broadcast_to(counts.sum(axis=0), num.shape)
+        else:
+            k = self._label_idx[label or self.labels[0]]
+            if by == "outlet":
+                names = [self.outlets[i] for i in o]
+                num, den = sums[:, :, k], counts
+            else:
+                group = self._region_of[o]
+                present = np.unique(group)
+                names = [self.regions[g] for g in present]
+                codes = np.searchsorted(present, group)
+                num = np.zeros((len(present), len(months)))
+                den = np.zeros((len(present), len(months)), dtype=np.int64)
+                np.add.at(num, codes, sums[:, :, k])
+                np.add.at(den, codes, counts)
+
+        starts = _period_starts(months, granularity)
+        if len(months):
+            num = np.add.reduceat(num, starts, axis=1)
+            den = np.add.reduceat(den, starts, axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = np.where(den > 0, 100 * num / den, np.nan).round(2)
+
+        periods = months[starts] if len(months) else months
+        df = pd.DataFrame({
+            "year_month": periods.astype("datetime64[M]").astype("datetime64[ns]"),
+            "label": _labels(periods, granularity),
+        })
+        for name, row in zip(names, share):
+            df[name] = row
+        df.attrs["version"] = (f"{self.version}|{by}|{label}|{','.join(outlets or [])}"
+                               f"|{years}|{granularity}")
+        df.attrs["granularity"] = granularity
+        return df
+
+    def overall(self, outlets: Sequence[str] | None = None) -> pd.Series:
+        """Part de couverture (%) de chaque cadre sur toute la période."""
+        sums, counts = self.cells()
+        if outlets:
+            o = [self._outlet_idx[n] for n in outlets]
+            sums, counts = sums[o], counts[o]
+        total = counts.sum()
+        share = 100 * sums.sum(axis=(0, 1)) / total if total else np.zeros(len(self.labels))
+        return pd.Series(share.round(2), index=self.labels, name="share")
+
+
+_scores: tuple[str, Scores | None] = ("", None)
+_lock = threading.Lock()
+
+
+def load_scores() -> Scores | None:
+    """Scores courants, ou None s’ils n’ont pas été construits."""
+    global _scores
+    path = snapshot.current(ANALYSIS_DIR)
+    if path is None:
+        return None
+    if _scores[0] != path.name:
+        with _lock:
+            if _scores[0] != path.name:
+                scores = np.load(path / "scores.npy", mmap_mode="r")
+                offsets = np.load(path / "offsets.npy")
+                dims = json.loads((path / "dims.json").read_text())
+                _scores = (path.name, Scores(scores, offsets, dims,
+                                             f"analysis@{path.name}"))
+    return _scores[1]
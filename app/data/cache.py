@@ -0,0 +1,153 @@
+"""
+Cache d’artefacts – résultats dérivés partagés entre pipeline et pages
+---------------------------------------------------------------------
+• data/processed/cache/<clé>.pkl ; clé = sha1(nom, empreinte des entrées,
+  version du code, arguments)
+  – entrées : empreinte de contenu fournie par l’appelant (ex.
+    corpus.fingerprint() = hash du manifest d’ingestion) → une ingestion
+    change la clé, jamais de résultat périmé
+  – code : hash du source des modules concernés → modifier le calcul
+    invalide aussi
+• LRU sur disque : mtime rafraîchi à chaque lecture, les plus anciens
+  supprimés au-delà de CCF_CACHE_MB (256 Mo par défaut)
+• écriture dans un fichier temporaire puis os.replace : plusieurs workers
+  web et jobs batch peuvent partager le dossier sans verrou
+• petit LRU mémoire devant le disque (MEMORY_ENTRIES objets par process)
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+ROOT = Path(__file__).resolve().parents[2]
+CACHE_DIR = ROOT / "data/processed/cache"
+MAX_BYTES = int(float(os.environ.get("CCF_CACHE_MB", 256)) * 1024 * 1024)
+MEMORY_ENTRIES = 64
+FORMAT = 1                               # à incrémenter si le format change
+
+MISS = object()
+
+_memory: OrderedDict[str, Any] = OrderedDict()
+_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+@lru_cache(maxsize=64)
+def _source_hash(path: str, mtime_ns: int) -> str:
+    return hashlib.sha1(Path(path).read_bytes()).hexdigest()[:12]
+
+
+def code_version(*paths: str | Path) -> str:
+    """Empreinte du source des fichiers *paths* (relu seulement si modifié)."""
+    return "-".join(_source_hash(str(p), Path(p).stat().st_mtime_ns) for p in paths)
+
+
+def key(name: str, *parts: Any) -> str:
+    raw = repr((FORMAT, name) + parts).encode()
+    return f"{name}-{hashlib.sha1(raw).hexdigest()[:20]}"
+
+
+def _path(k: str) -> Path:
+    return CACHE_DIR / f"{k}.pkl"
+
+
+def _remember(k: str, value: Any) -> None:
+    with _lock:
+        _memory[k] = value
+        _memory.move_to_end(k)
+        while len(_memory) > MEMORY_ENTRIES:
+            _memory.popitem(last=False)
+
+
+def get(k: str) -> Any:
+    """Valeur en cache, ou MISS."""
+    with _lock:
+        if k in _memory:
+            _memory.move_to_end(k)
+            _stats["hits"] += 1
+            return _memory[k]
+    fp = _path(k)
+    try:
+        with fp.open("rb") as fh:
+            value = pickle.load(fh)
+        os.utime(fp)                      # LRU : dernière utilisation
+    except (OSError, EOFError, pickle.UnpicklingError):
+        _stats["misses"] += 1
+        return MISS
+    _stats["hits"] += 1
+    _remember(k, value)
+    return value
+
+
+def put(k: str, value: Any) -> None:
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    fp = _path(k)
+    tmp = fp.with_name(f".{fp.name}.{os.getpid()}.{threading.get_ident()}")
+    with tmp.open("wb") as fh:
+        pickle.dump(value, fh, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, fp)
+    _remember(k, value)
+    evict()
+
+
+def evict(max_bytes: int = MAX_BYTES) -> int:
+    """Supprime les entrées les moins récemment utilisées au-delà de max_bytes."""
+    entries = []
+    for fp in CACHE_DIR.glob("*.pkl"):
+        try:
+            st = fp.stat()
+        except OSError:                   # supprimé par un autre process
+            continue
+        entries.append((st.st_mtime_ns, st.st_size, fp))
+    total = sum(size for _, size, _ in entries)
+    removed = 0
+    for _, size, fp in sorted(entries):
+        if total <= max_bytes:
+            break
+        fp.unlink(missing_ok=True)
+        total -= size
+        removed += 1
+    return removed
+
+
+def cached(name: str | None = None, inputs: Callable[[], str] | None = None,
+           code: Iterable[str | Path] = ()) -> Callable:
+    """Décorateur : résultat mis en cache par (entrées, code, arguments).
+
+    *inputs* renvoie l’empreinte des données lues par la fonction ; *code*
+    liste les fichiers source dont elle dépend en plus de son module.
+    """
+    extra = tuple(code)
+
+    def deco(fn: Callable) -> Callable:
+        label = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+        sources = (fn.__code__.co_filename,) + extra
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            k = key(label, inputs() if inputs else "", code_version(*sources),
+                    args, sorted(kwargs.items()))
+            value = get(k)
+            if value is MISS:
+                value = fn(*args, **kwargs)
+                put(k, value)
+            return value
+        return wrapper
+    return deco
+
+
+def clear() -> None:
+    with _lock:
+        _memory.clear()
+    for fp in CACHE_DIR.glob("*.pkl"):
+        fp.unlink(missing_ok=True)
+
+
+def cache_stats() -> dict[str, int]:
+    return dict(_stats, entries=len(_memory))
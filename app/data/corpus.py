@@ -0,0 +1,270 @@
+"""
+Corpus – métadonnées article par article (Parquet partitionné)
+--------------------------------------------------------------
+• data/processed/articles/outlet=<média>/year=<aaaa>/part-*.parquet
+• colonnes : id, date, month, language, n_words, title, text
+  (outlet et year vivent dans le chemin → élagage de partitions)
+• query() : projection de colonnes + filtres poussés au scan + group-by Arrow,
+  ou DuckDB (app.data.sql) s’il est installé (CCF_QUERY_BACKEND=arrow|duckdb)
+• articles_meta.arrow : métadonnées en Arrow IPC non compressé, lues en
+  mmap → pages partagées entre workers (make run WORKERS=n), zéro copie ;
+  ré-écrites lot par lot par `make data` seulement si une partition change
+• query() mis en cache sur disque (app.data.cache), clé = empreinte du
+  manifest d’ingestion → partagé entre `make data`/`make cube` et les pages
+• media_counts() / month_counts() : vues dérivées qui remplacent les CSV
+  faits à la main ; `python -m app.data.corpus export` les ré-écrit
+"""
+from __future__ import annotations
+
+import hashlib
+import os
+import sys
+import threading
+from datetime import date
+from pathlib import Path
+from typing import Iterable, Sequence
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from app.data import cache
+
+ROOT = Path(__file__).resolve().parents[2]
+PROCESSED = ROOT / "data/processed"
+CORPUS_DIR = PROCESSED / "articles"
+VERSION_FILE = CORPUS_DIR / "_version"
+MANIFEST = CORPUS_DIR / "_manifest.json"        # écrit par pipeline.ingest
+META_FILE = PROCESSED / "articles_meta.arrow"
+ASSETS = ROOT / "app/static/assets"
+
+PARTITIONING = ds.partitioning(
+    pa.schema([("outlet", pa.string()), ("year", pa.int16())]), flavor="hive")
+
+SCHEMA = pa.schema([
+    ("id", pa.string()),
+    ("outlet", pa.string()),
+    ("year", pa.int16()),
+    ("month", pa.int8()),
+    ("date", pa.date32()),
+    ("language", pa.dictionary(pa.int8(), pa.string())),
+    ("n_words", pa.int32()),
+    ("title", pa.string()),
+    ("text", pa.large_string()),
+])
+META_COLUMNS = ["id", "outlet", "year", "month", "date", "language", "n_words"]
+META_BATCH = 64_000
+BACKEND = os.environ.get("CCF_QUERY_BACKEND", "auto")
+
+_dataset: tuple[int, ds.Dataset | None] = (-1, None)
+_meta: tuple[int, ds.Dataset | None] = (-1, None)
+_fingerprint: tuple[int, str] = (-1, "")
+_lock = threading.Lock()
+
+
+# ─────────────────── écriture ─────────────────────────────────────────
+def write(table: pa.Table | pd.DataFrame, batch: str = "0") -> None:
+    """Ajoute *table* au corpus, un fichier part-<batch>-*.parquet par partition."""
+    if isinstance(table, pd.DataFrame):
+        table = pa.Table.from_pandas(table, preserve_index=False)
+    table = table.select(SCHEMA.names).cast(SCHEMA)
+    ds.write_dataset(
+        table, CORPUS_DIR, format="parquet", partitioning=PARTITIONING,
+        basename_template=f"part-{batch}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=ds.ParquetFileFormat().make_write_options(compression="zstd"),
+    )
+    VERSION_FILE.touch()
+
+
+# ─────────────────── lecture ──────────────────────────────────────────
+def version() -> int:
+    """mtime du dernier write() (0 si le corpus n’existe pas)."""
+    try:
+        return VERSION_FILE.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+def available() -> bool:
+    return version() > 0
+
+
+def fingerprint() -> str:
+    """Empreinte du contenu du corpus, pour les clés de app.data.cache.
+
+    Hash du manifest d’ingestion (empreinte de chaque dump brut) : une
+    ingestion sans changement garde la même empreinte. Sans manifest
+    (corpus écrit à la main), on retombe sur version().
+    """
+    global _fingerprint
+    try:
+        mtime = MANIFEST.stat().st_mtime_ns
+    except OSError:
+        return f"v{version()}"
+    if _fingerprint[0] != mtime:
+        digest = hashlib.sha1(MANIFEST.read_bytes()).hexdigest()[:16]
+        _fingerprint = (mtime, digest)
+    return _fingerprint[1]
+
+
+def dataset() -> ds.Dataset:
+    """Dataset Arrow, re-découvert seulement après un write()."""
+    global _dataset
+    v = version()
+    if not v:
+        raise FileNotFoundError(f"no corpus in {CORPUS_DIR} (run `make data`)")
+    if _dataset[0] != v:
+        with _lock:
+            if _dataset[0] != v:
+                _dataset = (v, ds.dataset(CORPUS_DIR, format="parquet",
+                                          partitioning=PARTITIONING,
+                                          exclude_invalid_files=True))
+    return _dataset[1]
+
+
+def export_meta() -> None:
+    """Écrit META_FILE (colonnes META_COLUMNS, sans titre ni texte).
+
+    Lot par lot (META_BATCH lignes en mémoire) ; language garde un seul
+    dictionnaire pour tout le fichier : le format IPC fichier n’accepte
+    pas qu’il change d’un lot à l’autre.
+    """
+    data = dataset()
+    langs: set[str] = set()
+    for batch in data.scanner(columns=["language"], batch_size=META_BATCH).to_batches():
+        langs.update(pc.unique(pc.cast(batch.column(0), pa.string())).to_pylist())
+    dictionary = pa.array(sorted(lang for lang in langs if lang is not None), pa.string())
+    schema = pa.schema([SCHEMA.field(c) for c in META_COLUMNS])
+    lang_type = schema.field("language").type
+
+    tmp = META_FILE.with_suffix(".tmp")
+    with pa.OSFile(str(tmp), "wb") as sink, pa.ipc.new_file(sink, schema) as writer:
+        for batch in data.scanner(columns=META_COLUMNS, batch_size=META_BATCH).to_batches():
+            cols = []
+            for field in schema:
+                col = batch.column(field.name)
+                if field.name == "language":
+                    codes = pc.index_in(pc.cast(col, pa.string()), value_set=dictionary)
+                    col = pa.DictionaryArray.from_arrays(
+                        codes.cast(lang_type.index_type), dictionary)
+                cols.append(col.cast(field.type))
+            writer.write_batch(pa.RecordBatch.from_arrays(cols, schema=schema))
+    os.replace(tmp, META_FILE)
+
+
+def meta_dataset() -> ds.Dataset | None:
+    """Métadonnées mappées en mémoire, ou None si META_FILE est absent / périmé."""
+    global _meta
+    try:
+        mtime = META_FILE.stat().st_mtime_ns
+    except OSError:
+        return None
+    if mtime < version():
+        return None                       # corpus ré-écrit depuis l’export
+    if _meta[0] != mtime:
+        with _lock:
+            if _meta[0] != mtime:
+                source = pa.memory_map(str(META_FILE))     # reste ouvert : zéro copie
+                _meta = (mtime, ds.dataset(pa.ipc.open_file(source).read_all()))
+    return _meta[1]
+
+
+def _filter(outlets: Sequence[str] | None = None,
+            years: tuple[int, int] | None = None,
+            start: date | None = None, end: date | None = None,
+            languages: Sequence[str] | None = None) -> ds.Expression | None:
+    """outlet/year → élagage de partitions ; date/language → filtres de scan."""
+    parts: list[ds.Expression] = []
+    if outlets:
+        parts.append(pc.field("outlet").isin(list(outlets)))
+    if years:
+        parts.append((pc.field("year") >= years[0]) & (pc.field("year") <= years[1]))
+    if start:
+        parts.append(pc.field("year") >= start.year)
+        parts.append(pc.field("date") >= pa.scalar(start, pa.date32()))
+    if end:
+        parts.append(pc.field("year") <= end.year)
+        parts.append(pc.field("date") <= pa.scalar(end, pa.date32()))
+    if languages:
+        parts.append(pc.field("language").isin(list(languages)))
+    expr = None
+    for p in parts:
+        expr = p if expr is None else expr & p
+    return expr
+
+
+def scan(columns: Iterable[str] | None = None, **filters) -> pa.Table:
+    """Colonnes demandées des articles qui passent les filtres (voir _filter)."""
+    cols = list(columns) if columns else META_COLUMNS
+    meta = meta_dataset() if set(cols) <= set(META_COLUMNS) else None
+    return (meta if meta is not None else dataset()).to_table(
+        columns=cols, filter=_filter(**filters))
+
+
+@cache.cached("corpus.query", inputs=fingerprint,
+              code=[Path(__file__).with_name("sql.py")])
+def query(group_by: Sequence[str], **filters) -> pd.DataFrame:
+    """Nombre d’articles par combinaison de *group_by* (ex. outlet × year).
+
+    Mis en cache sur disque (app.data.cache) par empreinte du corpus :
+    pipeline et pages partagent les résultats.
+    """
+    if BACKEND != "arrow":
+        from app.data import sql          # import tardif : sql importe ce module
+        if sql.available():
+            dataset()                     # même erreur claire si pas de corpus
+            return sql.counts(group_by, **filters)
+        if BACKEND == "duckdb":
+            raise ImportError("CCF_QUERY_BACKEND=duckdb but duckdb is not installed")
+    table = scan(list(group_by) + ["id"], **filters)
+    out = table.group_by(list(group_by)).aggregate(
+        [("id", "count", pc.CountOptions(mode="all"))])
+    out = out.rename_columns(
+        ["n_articles" if c == "id_count" else c for c in out.column_names])
+    return (out.select(list(group_by) + ["n_articles"])
+               .to_pandas()
+               .sort_values(list(group_by), kind="stable")
+               .reset_index(drop=True))
+
+
+# ─────────────────── vues dérivées ────────────────────────────────────
+def media_counts(**filters) -> pd.DataFrame:
+    """media, n_articles – même format que articles_by_media.csv."""
+    return (query(["outlet"], **filters)
+            .rename(columns={"outlet": "media"})
+            .sort_values("n_articles", ascending=False, kind="stable")
+            .reset_index(drop=True))
+
+
+def month_counts(**filters) -> pd.DataFrame:
+    """year, month, n_articles – même format que articles_by_month.csv."""
+    return query(["year", "month"], **filters)
+
+
+def export_aggregates(media: pd.DataFrame | None = None,
+                      month: pd.DataFrame | None = None) -> None:
+    """Ré-écrit les agrégats lus par app.data.loaders (Parquet + CSV).
+
+    Sans argument, ils sont recalculés sur tout le corpus ; l’ingestion
+    incrémentale passe ceux qu’elle a tenus à jour. Chaque fichier est
+    écrit à côté puis remplacé (os.replace) : un lecteur concurrent voit
+    l’ancienne version ou la nouvelle, jamais un fichier tronqué.
+    """
+    PROCESSED.mkdir(parents=True, exist_ok=True)
+    media = media_counts() if media is None else media
+    month = month_counts() if month is None else month
+    for name, df in (("articles_by_media", media), ("articles_by_month", month)):
+        for dst, write in ((PROCESSED / f"{name}.parquet", df.to_parquet),
+                           (ASSETS / f"{name}.csv", df.to_csv)):
+            tmp = dst.with_name(f"{dst.name}.tmp")
+            write(tmp, index=False)
+            os.replace(tmp, dst)
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["export"]:
+        export_aggregates()
+    else:
+        sys.exit("usage: python -m app.data.corpus export")
@@ -0,0 +1,86 @@
+"""
+Cube – comptes d’articles média × mois × langue
+-----------------------------------------------
+• tableau NumPy dense int32 (counts.npy, `make cube` ou `make data`)
+  + dictionnaires des axes (dims.json), publiés ensemble dans
+  data/processed/cube/<version>/ (app.data.snapshot)
+• chargé en mmap, re-chargé seulement quand une nouvelle version est publiée
+• toute tranche / somme = indexation + sum NumPy (quelques µs)
+"""
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Sequence
+
+import numpy as np
+import pandas as pd
+
+from app.data import snapshot
+
+ROOT = Path(__file__).resolve().parents[2]
+CUBE_DIR = ROOT / "data/processed/cube"
+
+
+class Cube:
+    def __init__(self, counts: np.ndarray, dims: dict, version: str) -> None:
+        self.counts = counts                      # (outlet, month, language)
+        self.outlets: list[str] = dims["outlets"]
+        self.languages: list[str] = dims["languages"]
+        self.first_month: int = dims["first_month"]   # mois depuis 1970-01
+        self.version = version
+        self._outlet_idx = {o: i for i, o in enumerate(self.outlets)}
+        self._lang_idx = {lang: i for i, lang in enumerate(self.languages)}
+
+    @property
+    def months(self) -> np.ndarray:
+        """Axe des mois (datetime64[M])."""
+        return (self.first_month + np.arange(self.counts.shape[1])).astype("datetime64[M]")
+
+    def _axis(self, names: Sequence[str] | None, index: dict[str, int]):
+        return slice(None) if not names else [index[n] for n in names]
+
+    def slice(self, outlets: Sequence[str] | None = None,
+              languages: Sequence[str] | None = None) -> np.ndarray:
+        """(média, mois) sommé sur les langues demandées."""
+        o = self._axis(outlets, self._outlet_idx)
+        lang = self._axis(languages, self._lang_idx)
+        return self.counts[o][:, :, lang].sum(axis=2)
+
+    def total(self, outlets: Sequence[str] | None = None,
+              languages: Sequence[str] | None = None) -> np.ndarray:
+        """Série mensuelle tous médias demandés confondus."""
+        return self.slice(outlets, languages).sum(axis=0)
+
+    def frame(self, outlets: Sequence[str] | None = None,
+              languages: Sequence[str] | None = None) -> pd.DataFrame:
+        """year, month + une colonne par média (format de app.data.resample)."""
+        names = list(outlets) if outlets else self.outlets
+        values = self.slice(names, languages)
+        m = self.first_month + np.arange(values.shape[1])
+        df = pd.DataFrame({"year": m // 12 + 1970, "month": m % 12 + 1})
+        for name, row in zip(names, values):
+            df[name] = row
+        df.attrs["version"] = (f"{self.version}|{','.join(names)}"
+                               f"|{','.join(languages or [])}")
+        return df
+
+
+_cube: tuple[str, Cube | None] = ("", None)
+_lock = threading.Lock()
+
+
+def load_cube() -> Cube | None:
+    """Cube courant, ou None s’il n’a pas été construit."""
+    global _cube
+    path = snapshot.current(CUBE_DIR)
+    if path is None:
+        return None
+    if _cube[0] != path.name:
+        with _lock:
+            if _cube[0] != path.name:
+                counts = np.load(path / "counts.npy", mmap_mode="r")
+                dims = json.loads((path / "dims.json").read_text())
+                _cube = (path.name, Cube(counts, dims, f"cube@{path.name}"))
+    return _cube[1]
@@ -0,0 +1,77 @@
+"""
+Loaders – agrégats du corpus (articles par média / par mois)
+------------------------------------------------------------
+• lus une seule fois par process, ré-lus seulement si le mtime change
+• dtypes explicites, index mensuel construit en vectoriel (year/month int)
+• data/processed/<nom>.parquet prioritaire sur le CSV de app/static/assets
+• les DataFrames renvoyés sont partagés entre sessions : lecture seule !
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[2]
+ASSETS = ROOT / "app/static/assets"
+PROCESSED = ROOT / "data/processed"
+
+MEDIA = "articles_by_media"
+MONTH = "articles_by_month"
+
+
+def _source(name: str) -> Path:
+    parquet = PROCESSED / f"{name}.parquet"
+    return parquet if parquet.exists() else ASSETS / f"{name}.csv"
+
+
+def _read(path: Path, columns: list[str], dtype: dict[str, str]) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_csv(path, usecols=columns, dtype=dtype)
+
+
+@lru_cache(maxsize=4)
+def _media(path: Path, mtime: int) -> pd.DataFrame:
+    df = _read(path, ["media", "n_articles"],
+               {"media": "string", "n_articles": "int64"})
+    df = (df.astype({"media": "string", "n_articles": "int64"})
+            .sort_values("n_articles", ascending=False, kind="stable")
+            .reset_index(drop=True))
+    df.attrs["version"] = f"{path.name}@{mtime}"
+    return df
+
+
+@lru_cache(maxsize=4)
+def _month(path: Path, mtime: int) -> pd.DataFrame:
+    # anciens CSV : year/month en float (« 1978.0 ») → lus en float puis castés
+    df = _read(path, ["year", "month", "n_articles"],
+               {"year": "float64", "month": "float64", "n_articles": "int64"})
+    df = (df.dropna(subset=["year", "month"])
+            .astype({"year": "int16", "month": "int8", "n_articles": "int64"}))
+    months = (df["year"].to_numpy(np.int64) - 1970) * 12 + df["month"].to_numpy(np.int64) - 1
+    df["year_month"] = months.astype("datetime64[M]").astype("datetime64[ns]")
+    df = df.sort_values("year_month", kind="stable").reset_index(drop=True)
+    df.attrs["version"] = f"{path.name}@{mtime}"
+    return df
+
+
+def load_media_counts() -> pd.DataFrame:
+    """media (string), n_articles (int64), trié par volume décroissant."""
+    path = _source(MEDIA)
+    return _media(path, path.stat().st_mtime_ns)
+
+
+def load_month_counts() -> pd.DataFrame:
+    """year (int16), month (int8), n_articles (int64), year_month (datetime64)."""
+    path = _source(MONTH)
+    return _month(path, path.stat().st_mtime_ns)
+
+
+def cache_stats() -> dict[str, int]:
+    infos = [_media.cache_info(), _month.cache_info()]
+    return dict(entries=sum(i.currsize for i in infos),
+                hits=sum(i.hits for i in infos),
+                misses=sum(i.misses for i in infos))
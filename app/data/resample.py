@@ -0,0 +1,115 @@
+"""
+Resampling – série « articles par mois »
+----------------------------------------
+• agrégation mensuelle / trimestrielle / annuelle (clés entières, groupby)
+• Largest-Triangle-Three-Buckets si la série dépasse max_points
+• plusieurs colonnes de valeurs (une par média) : mêmes points retenus pour
+  toutes, choisis sur leur somme
+• résultat mémoïsé par (version des données, granularité, max_points),
+  LRU borné à CACHE_ENTRIES séries (une par combinaison de médias vue)
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+GRANULARITIES = ("month", "quarter", "year")
+MAX_POINTS = int(os.environ.get("CCF_MAX_POINTS", 240))
+
+CACHE_ENTRIES = 32
+
+_CACHE: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Indices des n_out points retenus par LTTB (premier et dernier inclus)."""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # n_out-2 seaux entre le premier et le dernier point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0], out[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        nxt = slice(hi, edges[i + 2] if i + 2 < len(edges) else n)
+        cx, cy = x[nxt].mean(), y[nxt].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a])
+                      - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(area.argmax())
+        out[i + 1] = a
+    return out
+
+
+def aggregate(df: pd.DataFrame, granularity: str = "month") -> pd.DataFrame:
+    """Somme les colonnes de valeurs par mois, trimestre ou année.
+
+    Colonnes de valeurs = toutes sauf year / month / year_month ; le
+    résultat ajoute year_month (début de période) et label, et garde la
+    granularité dans attrs["granularity"].
+    """
+    year = df["year"].to_numpy(np.int64)
+    month = df["month"].to_numpy(np.int64)
+    if granularity == "quarter":
+        month = (month - 1) // 3 * 3 + 1
+    elif granularity == "year":
+        month = np.ones_like(month)
+    elif granularity != "month":
+        raise ValueError(f"granularity must be one of {GRANULARITIES}")
+
+    key = (year - 1970) * 12 + month - 1          # mois depuis 1970-01
+    values = [c for c in df.columns if c not in ("year", "month", "year_month")]
+    sums = df[values].groupby(key, sort=True).sum()
+    idx = sums.index.to_numpy(np.int64)
+    y, m = idx // 12 + 1970, idx % 12 + 1
+    if granularity == "month":
+        label = [f"{a}‑{b:02d}" for a, b in zip(y, m)]
+    elif granularity == "quarter":
+        label = [f"{a} Q{(b - 1) // 3 + 1}" for a, b in zip(y, m)]
+    else:
+        label = [str(a) for a in y]
+    out = pd.DataFrame({
+        "year_month": idx.astype("datetime64[M]").astype("datetime64[ns]"),
+        "label": label,
+        "_key": idx,
+    })
+    for col in values:
+        out[col] = sums[col].to_numpy(np.int64)
+    out.attrs["granularity"] = granularity   # axe temporel (app.components.charts)
+    return out
+
+
+def resample_months(df: pd.DataFrame, granularity: str = "month",
+                    max_points: int = MAX_POINTS) -> pd.DataFrame:
+    """Série agrégée puis réduite à max_points au plus (LTTB)."""
+    version = df.attrs.get("version")
+    key = (version, granularity, max_points)
+    if version is not None:
+        with _LOCK:
+            if key in _CACHE:
+                _CACHE.move_to_end(key)
+                return _CACHE[key]
+
+    out = aggregate(df, granularity)
+    if len(out) > max_points:
+        values = out.columns.difference(["year_month", "label", "_key"])
+        keep = lttb(out["_key"].to_numpy(), out[values].sum(axis=1).to_numpy(),
+                    max_points)
+        out = out.iloc[keep]
+    out = out.drop(columns="_key").reset_index(drop=True)
+    if version is not None:
+        out.attrs["version"] = f"{version}|{granularity}|{max_points}"
+        with _LOCK:
+            _CACHE[key] = out
+            _CACHE.move_to_end(key)
+            while len(_CACHE) > CACHE_ENTRIES:
+                _CACHE.popitem(last=False)
+    return out
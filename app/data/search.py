@@ -0,0 +1,96 @@
+"""
+Search – requêtes sur l’index FTS5 (pipeline/search_index.py)
+-------------------------------------------------------------
+• syntaxe FTS5 : mots (ET implicite), OR, NOT, "expression exacte", préfixe*
+• filtres média / dates, pagination, extraits surlignés
+• connexion SQLite en lecture seule, une par thread : les textes restent
+  sur disque, seule la page demandée est lue
+"""
+from __future__ import annotations
+
+import html
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+from typing import Sequence
+
+ROOT = Path(__file__).resolve().parents[2]
+SEARCH_DB = ROOT / "data/processed/search.sqlite"
+
+PER_PAGE = 20
+_MARK = ("\x02", "\x03")                 # délimiteurs d’extrait, échappés ensuite
+
+_local = threading.local()
+
+
+@dataclass(frozen=True)
+class Hit:
+    id: str
+    outlet: str
+    day: str
+    title: str
+    snippet: str                          # HTML sûr, termes en <mark>
+
+
+def available() -> bool:
+    return SEARCH_DB.exists()
+
+
+def _con() -> sqlite3.Connection:
+    mtime = SEARCH_DB.stat().st_mtime_ns
+    con = getattr(_local, "con", None)
+    if con is None or _local.mtime != mtime:  # index reconstruit → on rouvre
+        if con is not None:
+            con.close()
+        con = sqlite3.connect(f"file:{SEARCH_DB}?mode=ro", uri=True)
+        _local.con, _local.mtime = con, mtime
+    return con
+
+
+def _where(outlets: Sequence[str] | None, start: date | None,
+           end: date | None) -> tuple[str, list]:
+    sql, params = "fts MATCH ?", []
+    if outlets:
+        sql += f" AND a.outlet IN ({','.join('?' * len(outlets))})"
+        params += list(outlets)
+    if start:
+        sql += " AND a.day >= ?"
+        params.append(start.isoformat())
+    if end:
+        sql += " AND a.day <= ?"
+        params.append(end.isoformat())
+    return sql, params
+
+
+def _highlight(raw: str | None) -> str:
+    return (html.escape(raw or "")
+            .replace(_MARK[0], "<mark>").replace(_MARK[1], "</mark>"))
+
+
+def search(q: str, outlets: Sequence[str] | None = None,
+           start: date | None = None, end: date | None = None,
+           page: int = 1, per_page: int = PER_PAGE) -> tuple[int, list[Hit]]:
+    """(nombre total de résultats, résultats de la page *page*)."""
+    where, params = _where(outlets, start, end)
+    con = _con()
+    try:
+        total = con.execute(
+            f"SELECT count(*) FROM fts JOIN articles a ON a.rowid = fts.rowid "
+            f"WHERE {where}", [q, *params]).fetchone()[0]
+        rows = con.execute(
+            f"SELECT a.id, a.outlet, a.day, a.title, "
+            f"       snippet(fts, 1, ?, ?, ' … ', 24) "
+            f"FROM fts JOIN articles a ON a.rowid = fts.rowid "
+            f"WHERE {where} ORDER BY fts.rank LIMIT ? OFFSET ?",
+            [*_MARK, q, *params, per_page, (page - 1) * per_page]).fetchall()
+    except sqlite3.OperationalError as exc:   # syntaxe FTS5 invalide
+        raise ValueError(f"invalid search query: {exc}") from None
+    return total, [Hit(i, o, d, t or "", _highlight(s)) for i, o, d, t, s in rows]
+
+
+def outlets() -> list[str]:
+    con = _con()
+    return [r[0] for r in con.execute(
+        "SELECT DISTINCT outlet FROM articles ORDER BY outlet")]
@@ -0,0 +1,57 @@
+"""
+Snapshots – jeux d’artefacts NumPy publiés d’un seul coup
+--------------------------------------------------------
+• un build écrit tous ses fichiers (.npy + dims.json) dans un dossier
+  neuf <base>/<version>/, puis remplace atomiquement <base>/CURRENT
+  (une ligne : le nom de la version)
+• un worker qui recharge lit CURRENT puis ce dossier-là : il voit
+  l’ancien jeu complet ou le nouveau, jamais une matrice avec les axes
+  d’un autre build (cube, analysis, plusieurs workers web)
+• les KEEP dernières versions sont gardées ; les plus anciennes sont
+  supprimées (un mmap ouvert reste valide sous Linux)
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+import numpy as np
+
+KEEP = 3
+
+
+def publish(base: Path, arrays: dict[str, np.ndarray], dims: dict) -> Path:
+    """Écrit <nom>.npy pour chaque tableau + dims.json, puis bascule CURRENT."""
+    base.mkdir(parents=True, exist_ok=True)
+    version = f"v{time.time_ns():x}-{os.getpid()}"
+    tmp = base / f".{version}"            # « . » : jamais pris pour une version
+    tmp.mkdir()
+    for name, array in arrays.items():
+        np.save(tmp / f"{name}.npy", array)
+    (tmp / "dims.json").write_text(json.dumps(dims))
+    os.replace(tmp, base / version)
+
+    pointer = base / f".CURRENT.{os.getpid()}"
+    pointer.write_text(version)
+    os.replace(pointer, base / "CURRENT")
+    prune(base)
+    return base / version
+
+
+def current(base: Path) -> Path | None:
+    """Dossier de la version courante, None si rien n’a été publié."""
+    try:
+        version = (base / "CURRENT").read_text().strip()
+    except OSError:
+        return None
+    return base / version if version else None
+
+
+def prune(base: Path, keep: int = KEEP) -> None:
+    live = (base / "CURRENT").read_text().strip()
+    versions = sorted(p for p in base.glob("v*") if p.is_dir() and p.name != live)
+    for old in versions[:max(0, len(versions) - (keep - 1))]:
+        shutil.rmtree(old, ignore_errors=True)
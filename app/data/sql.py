@@ -0,0 +1,110 @@
+"""
+SQL backend – DuckDB embarqué sur le corpus Parquet
+---------------------------------------------------
+• optionnel : si duckdb n’est pas installé, app.data.corpus reste sur Arrow
+• une connexion de base par process + un pool de curseurs (un par requête
+  concurrente) ; rien n’est chargé en mémoire pandas avant le group-by
+• requêtes paramétrées uniquement ; les colonnes de group-by viennent d’une
+  liste blanche (GROUPABLE), jamais de l’utilisateur tel quel
+"""
+from __future__ import annotations
+
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from datetime import date
+from typing import Iterator, Sequence
+
+import pandas as pd
+
+try:
+    import duckdb
+except ImportError:                       # dépendance optionnelle
+    duckdb = None
+
+from app.data.corpus import CORPUS_DIR
+
+GROUPABLE = ("outlet", "year", "month", "language")
+POOL_SIZE = int(os.environ.get("CCF_DUCKDB_POOL", 4))
+MEMORY_LIMIT = os.environ.get("CCF_DUCKDB_MEMORY", "512MB")
+
+_VIEW = f"""
+CREATE OR REPLACE VIEW articles AS
+SELECT * FROM read_parquet('{CORPUS_DIR.as_posix()}/**/*.parquet',
+                           hive_partitioning = true,
+                           hive_types = {{'outlet': VARCHAR, 'year': SMALLINT}})
+"""
+
+# filtres communs ; un paramètre NULL désactive son prédicat
+_WHERE = """
+WHERE ($outlets IS NULL OR list_contains($outlets, outlet))
+  AND ($year_min IS NULL OR year >= $year_min)
+  AND ($year_max IS NULL OR year <= $year_max)
+  AND ($start IS NULL OR date >= $start)
+  AND ($end IS NULL OR date <= $end)
+  AND ($languages IS NULL OR list_contains($languages, language))
+"""
+
+
+def available() -> bool:
+    return duckdb is not None
+
+
+class _Pool:
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self._base = None
+        self._free: queue.Queue = queue.Queue()
+        self._lock = threading.Lock()
+
+    def _init(self) -> None:
+        base = duckdb.connect(":memory:")
+        base.execute(f"SET memory_limit = '{MEMORY_LIMIT}'")
+        base.execute(_VIEW)
+        for _ in range(self.size):
+            self._free.put(base.cursor())
+        self._base = base
+
+    @contextmanager
+    def connection(self) -> Iterator["duckdb.DuckDBPyConnection"]:
+        if self._base is None:
+            with self._lock:
+                if self._base is None:
+                    self._init()
+        con = self._free.get()            # bloque si toutes sont prises
+        try:
+            yield con
+        finally:
+            self._free.put(con)
+
+
+_POOL = _Pool(POOL_SIZE)
+
+
+def _params(outlets: Sequence[str] | None = None,
+            years: tuple[int, int] | None = None,
+            start: date | None = None, end: date | None = None,
+            languages: Sequence[str] | None = None) -> dict:
+    return dict(outlets=list(outlets) if outlets else None,
+                year_min=years[0] if years else None,
+                year_max=years[1] if years else None,
+                start=start, end=end,
+                languages=list(languages) if languages else None)
+
+
+def counts(group_by: Sequence[str], **filters) -> pd.DataFrame:
+    """Même contrat que app.data.corpus.query, exécuté par DuckDB."""
+    bad = set(group_by) - set(GROUPABLE)
+    if bad:
+        raise ValueError(f"cannot group by {sorted(bad)}; allowed: {GROUPABLE}")
+    keys = ", ".join(group_by)
+    sql = (f"SELECT {keys}, count(*) AS n_articles FROM articles {_WHERE}"
+           f"GROUP BY {keys} ORDER BY {keys}")
+    with _POOL.connection() as con:
+        return con.execute(sql, _params(**filters)).df()
+
+
+def crosstab(**filters) -> pd.DataFrame:
+    """outlet × year × language, format long."""
+    return counts(["outlet", "year", "language"], **filters)
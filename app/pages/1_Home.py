@@ -4,10 +4,14 @@ CCF ‑ Home page  – media‑logo edition
 • même contenu qu’avant + apparition des logos des 20 médias
   (transparents, éparpillés aléatoirement derrière le logo CCF)
 • tous les tempos restent centralisés dans ANIM
+• le hero est envoyé une seule fois ; logos des médias et photos de
+  l’équipe y sont des <img loading="lazy"> : en mode CCF_ASSET_MODE=url,
+  des URL statiques hachées que le navigateur télécharge après le premier
+  rendu, hors du message Streamlit ; sinon des data URI (image_src)
 """
 
 from __future__ import annotations
-import base64, html as esc, random, sys
+import html as esc, random, sys
 from pathlib import Path
 from typing import List, Dict
 
@@ -16,8 +20,10 @@ ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from app.components.assets     import image_src
 from app.components.navbar     import navbar
-from app.components.ui_utils   import hide_sidebar
+from app.components            import profiling
+from app.components            import styles
 
 # ------------------------------------------------------------------ #
 # 0.  Animation parameters (s)                                        #
@@ -41,21 +47,19 @@ MEDIA_DIR  = BASE_DIR / "static/assets/media"      # 20 logos
 
 st.set_page_config("CCF – Home", "🌎", layout="centered",
                    initial_sidebar_state="collapsed")
+profiling.begin("Home")
 navbar(active="Home")
-hide_sidebar()
 
 if not (CSS_FILE.exists() and LOGO_FILE.exists() and MEDIA_DIR.exists()):
     st.error("Missing assets"); st.stop()
 
 # background CCF logo
-logo_url = "data:image/png;base64," + base64.b64encode(
-    LOGO_FILE.read_bytes()).decode()
+logo_url = image_src(LOGO_FILE, width=512)    # ≤ 40vw à l’écran
 
 
 # ------------------------------------------------------------------ #
 # 2.  Media logos • positions stratifiées (grille + jitter)          #
 # ------------------------------------------------------------------ #
-import math, random
 
 media_files = sorted(fp for fp in MEDIA_DIR.iterdir() if fp.is_file())
 N = len(media_files)
@@ -67,7 +71,7 @@ DESC = ("With 250,000 Canadian news articles since 1978 and advanced "
         "and outlets.")
 WORD_SPANS = "".join(
     f'<span class="type-word" '
-    f'style="animation-delay:{ANIM['desc_wait']+i*ANIM['word_step']:.2f}s">'
+    f'style="animation-delay:{ANIM["desc_wait"]+i*ANIM["word_step"]:.2f}s">'
     f'{esc.escape(w)}&nbsp;</span>' for i, w in enumerate(DESC.split())
 )
 
@@ -121,16 +125,18 @@ positions = top_slots + positions
 positions = positions[:N]            # garde exactement 20 positions
 
 
-# ── HTML des logos ─────────────────────────────────────────────────
-media_imgs = []
-for idx, (fp, (x, y)) in enumerate(zip(media_files, positions)):
-    b64 = base64.b64encode(fp.read_bytes()).decode()
-    delay = media_start + idx * ANIM["media_step"]
-    media_imgs.append(
-        f'<img src="data:image/{fp.suffix.lstrip(".")};base64,{b64}" '
-        f'class="media-logo" style="--delay:{delay:.2f}s; '
-        f'left:{x:.2f}%; top:{y:.2f}%;" alt="{fp.stem}"/>'
-    )
+# ── HTML des logos (chargés en différé, après le hero) ────────────
+@profiling.profiled()
+def media_layer() -> str:
+    imgs = []
+    for idx, (fp, (x, y)) in enumerate(zip(media_files, positions)):
+        delay = media_start + idx * ANIM["media_step"]
+        imgs.append(
+            f'<img src="{image_src(fp, width=80)}" loading="lazy" decoding="async" '
+            f'class="media-logo" style="--delay:{delay:.2f}s; '
+            f'left:{x:.2f}%; top:{y:.2f}%;" alt="{fp.stem}"/>'
+        )
+    return "".join(imgs)
 
 
 
@@ -149,12 +155,13 @@ TEAM: List[Dict[str, str]] = [
          url="https://www.chairedemocratie.com/members/taylor-matthew/"),
 ]
 
+@profiling.profiled()
 def card(m: Dict[str, str]) -> str:
-    """Retourne la carte HTML d’un membre avec photo cliquable."""
+    """Retourne la carte HTML d’un membre avec photo cliquable (chargée en différé)."""
     if m["photo"].exists():
-        img_b64 = base64.b64encode(m["photo"].read_bytes()).decode()
         img_tag = (f'<a href="{m["url"]}" target="_blank" class="member-photo">'
-                   f'<img src="data:image/jpeg;base64,{img_b64}" alt="{m["name"]} photo"></a>')
+                   f'<img src="{image_src(m["photo"], 128, 128)}" loading="lazy" '
+                   f'decoding="async" alt="{m["name"]} photo"></a>')
     else:
         img_tag = ""
     return (f'<div class="member">{img_tag}'
@@ -169,20 +176,16 @@ def card(m: Dict[str, str]) -> str:
 
 
 # ------------------------------------------------------------------ #
-# 5.  Inject CSS (variables)                                         #
+# 5.  Inject CSS (chrome + home + variables, un seul bloc)           #
 # ------------------------------------------------------------------ #
 css_vars = ";".join(f"--{k}:{v}s" for k, v in ANIM.items())
-st.markdown(
-    f"<style>:root{{{css_vars}}}</style>",
-    unsafe_allow_html=True,
-)
-st.markdown(f"<style>{CSS_FILE.read_text()}</style>", unsafe_allow_html=True)
+styles.inject("Home", extra=f":root{{{css_vars}}}")
 
 # ------------------------------------------------------------------ #
 # 6.  Final HTML                                                     #
 # ------------------------------------------------------------------ #
-st.markdown(
-f"""
+def hero_html(media: str, team: str) -> str:
+    return f"""
 <section class="hero">
 
   <!-- background CCF logo -->
@@ -190,7 +193,7 @@ f"""
 
   <!-- translucent media logos (behind everything) -->
   <div class="media-layer">
-    {''.join(media_imgs)}
+    {media}
   </div>
 
   <!-- main headline -->
@@ -209,9 +212,18 @@ f"""
   <!-- team -->
   <h2 class="team-title">Project Members</h2>
   <div class="team-row">
-    {''.join(card(m) for m in TEAM)}
+    {team}
   </div>
 
 </section>
-""",
-unsafe_allow_html=True)
+"""
+
+
+# Un seul message : le hero ne porte que des URL pour les logos des médias
+# et les photos (quelques octets chacune) ; le navigateur les télécharge
+# en parallèle une fois le hero affiché, puis les sert depuis son cache.
+with profiling.section("hero"):
+    st.markdown(hero_html(media_layer(), "".join(card(m) for m in TEAM)),
+                unsafe_allow_html=True)
+
+profiling.end()
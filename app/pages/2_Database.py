@@ -3,8 +3,10 @@ Database page
 -------------
 1. Sticky navbar (component)
 2. Scrolling banner of outlet logos
-3. Title ▸ buttons ▸ description (word-by-word)
-4. ECharts in place – no full page reload
+3. Title
+4. Fragment : buttons ▸ description (word-by-word) ▸ ECharts – a click
+   reruns only this block, not the navbar / banner above; the chart is a
+   persistent component updated in place (click a bar → that outlet over time)
 """
 from __future__ import annotations
 import sys
@@ -18,37 +20,33 @@ ROOT = Path(__file__).resolve().parents[2]
 sys.path.insert(0, str(ROOT))          # AUCUN import « app. » avant ceci !
 
 # ─────────────────── 2.  imports projet & tiers ───────────────────────
+from app.components.assets import image_src
+from app.components import profiling
 from app.components.navbar import navbar
-from app.components.ui_utils import hide_sidebar
+from app.components import styles
+# charts / données (pandas, NumPy) : importés dans explorer(), seulement
+# quand une vue est choisie → premier rendu sans ces dépendances
 
-import json, html as esc, base64
-import pandas as pd
+import html as esc
 import streamlit as st
-from streamlit.components.v1 import html
 
 # ─────────────────── 3.  chemins & assets ─────────────────────────────
 ASSETS        = ROOT / "app/static/assets"
 MEDIA_IMG_DIR = ASSETS / "media"
-CSS_DIR       = ROOT  / "app/static/css"
     
 # ─────────────────── 5.  config Streamlit & CSS ───────────────────────
 st.set_page_config(page_title="CCF – Database",
                    page_icon="🌎",
                    layout="centered",
                    initial_sidebar_state="collapsed")
+profiling.begin("Database")
+styles.inject("Database")           # chrome + home + navbar + database.css
 navbar(active="Database")
-hide_sidebar()
-
-for css in ("home.css", "database.css",):          # virgule = tuple d’un seul élément
-    css_path = CSS_DIR / css
-    if css_path.exists():
-        st.markdown(f"<style>{css_path.read_text()}</style>", unsafe_allow_html=True)
-    else:
-        st.warning(f"CSS file not found: {css_path}")
 
 
 # ─────────────────── 6.  constantes ──────────────────────────────────
 AXES_WAIT, MEDIA_MS, TIME_MS = 400, 200, 3000
+TIME_BUDGET_MS = 8000            # durée max de l’animation de la courbe
 TITLE_WORDS = ["The", "CCF", "Database"]
 BASE, STEP  = 0.30, 0.06         # animation pas-à-pas
 
@@ -58,35 +56,19 @@ if "view" not in st.session_state:
 view = st.session_state.view
 
 # ────────────────────────  banner of logos  ──────────────────────────
+@profiling.profiled()
 def build_logo_banner() -> str:
-    """Retourne le HTML/CSS d’un ruban infini de logos."""
+    """Retourne le HTML d’un ruban infini de logos (CSS : database.css)."""
     imgs: list[str] = []
     for fp in sorted(MEDIA_IMG_DIR.iterdir()):
         if not fp.is_file():
             continue
-        b64 = base64.b64encode(fp.read_bytes()).decode()
-        ext = fp.suffix.lstrip(".")
         imgs.append(
-            f'<img src="data:image/{ext};base64,{b64}" '
+            f'<img src="{image_src(fp, height=60)}" '
             f'alt="{fp.stem} logo" loading="lazy" />'
         )
     track = "".join(imgs * 2)  # ← on colle la liste deux fois
     return f"""
-    <style>
-      /* largeur de la piste = 200 % → on décale de −50 % */
-      @keyframes scroll-x {{
-        from {{ transform:translateX(0) }}
-        to   {{ transform:translateX(-50%) }}
-      }}
-      .media-banner  {{ width:100%; overflow:hidden; padding:.4rem 0; }}
-      .banner-track {{ display:flex; gap:2.5rem;
-                       animation:scroll-x 28s linear infinite; }}
-      .banner-track img {{ height:60px; object-fit:contain;
-                           filter:grayscale(20%); opacity:.9; }}
-      /* pause au survol (optionnel) */
-      .media-banner:hover .banner-track {{ animation-play-state:paused }}
-    </style>
-
     <div class="media-banner">
       <div class="banner-track">{track}</div>
     </div>
@@ -95,7 +77,7 @@ def build_logo_banner() -> str:
 
 st.markdown(build_logo_banner(), unsafe_allow_html=True)
 
-# ────────────────────────  TITLE  +  BUTTONS  +  DESC  ───────────────
+# ────────────────────────  TITLE  ────────────────────────────────────
 view = st.session_state.view
 
 # — title (animated only once) ----------------------------------------
@@ -109,98 +91,99 @@ else:
 
 st.markdown(f'<h1 class="db-title">{title_html}</h1>', unsafe_allow_html=True)
 
-# — buttons (centre + no reload) -------------------------------------
-col1, col2, col3 = st.columns([1, 2, 1])
-with col2:
-    c1, c2 = st.columns(2, gap="large")
-    if c1.button("Show data by media"):
-        st.session_state.view = "media"
-        view = "media"
-    if c2.button("Show articles over time"):
-        st.session_state.view = "time"
-        view = "time"
-
-# — description text --------------------------------------------------
-INTRO = {
-    None: ("We exhaustively collected more than 250 000 news articles since 1978 "
-           "from 20 major Canadian newspapers, extracting full texts and metadata. "
-           "Explore the outlets and their article volume over time."),
-    "media": ("We collected climate‑change articles from 20 outlets representative "
-              "of the Canadian media landscape and with the largest readership. "
-              "Below they are ordered by article count."),
-    "time": ("We gathered articles reaching as far back as possible to build a corpus "
-             "that is both geographically and historically exhaustive across Canada."),
-}[view]
-
-delay0 = BASE + 0.40 if view is None else 0.10
-desc_html = "".join(
-    f'<span class="type-word" style="animation-delay:{delay0+i*STEP:.2f}s">'
-    f'{esc.escape(w)}&nbsp;</span>'
-    for i, w in enumerate(INTRO.split())
-)
-desc_cls = "db-description alt" if view else "db-description"
-st.markdown(f'<p class="{desc_cls}">{desc_html}</p>', unsafe_allow_html=True)
-
-# ────────────────────────  DATA & CHART  ─────────────────────────────
-media_df = pd.read_csv(ASSETS / "articles_by_media.csv")
-month_df = (
-    pd.read_csv(ASSETS / "articles_by_month.csv")
-      .dropna(subset=["year", "month"])
-      # ①  on force year → int  (passe de 1978.0 → 1978)
-      .assign(year=lambda d: d["year"].astype(int),
-              month=lambda d: d["month"].astype(int))
-      # ②  on crée l’objet AAAA‑MM puis on ordonne
-      .assign(year_month=lambda d:
-              pd.to_datetime(d["year"].astype(str) + "-" +
-                             d["month"].astype(str).str.zfill(2)))
-      .sort_values("year_month")
-)
-
-
-if view:
-    st.markdown(
-        f"<h2 class='db-chart-title'>"
-        f"{'Articles by Media' if view=='media' else 'Articles per Month'}</h2>",
-        unsafe_allow_html=True,
-    )
-
-    if view == "media":
-        labs = media_df.media.tolist()
-        vals = media_df.n_articles.tolist()
-        option = f"""{{
-          tooltip:{{trigger:'axis'}},
-          xAxis:{{type:'category',data:{json.dumps(labs)},axisLabel:{{rotate:35}}}},
-          yAxis:{{type:'value',name:'Articles'}},
-          series:[{{type:'bar',data:{json.dumps(vals)},
-            itemStyle:{{color:{{type:'linear',x:0,y:0,x2:0,y2:1,
-              colorStops:[{{offset:0,color:'#f0f1f2'}},
-                          {{offset:1,color:'#41626a'}}]}}}},
-            animationDelay:(i)=>{AXES_WAIT}+{MEDIA_MS}*i,
-            animationDuration:{MEDIA_MS}}}]
-        }}"""
-    else:
-        labs = month_df.year_month.dt.strftime("%Y‑%m").tolist()
-        vals = month_df.n_articles.tolist()
-        option = f"""{{
-          tooltip:{{trigger:'axis'}},
-          xAxis:{{type:'category',data:{json.dumps(labs)}}},
-          yAxis:{{type:'value',name:'Articles'}},
-          series:[{{type:'line',data:{json.dumps(vals)},smooth:true,symbol:'circle',
-            lineStyle:{{width:3,color:'#41626a'}},
-            areaStyle:{{color:'rgba(65,98,106,0.15)'}},
-            animationDelay:(i)=>{AXES_WAIT}+{TIME_MS}*i,
-            animationDuration:{TIME_MS}}}]
-        }}"""
-
-    html(
-        f"""
-<div id="eplot" style="width:100%;max-width:900px;height:520px;margin:auto"></div>
-<script src="https://cdn.jsdelivr.net/npm/echarts@5/dist/echarts.min.js"></script>
-<script>
-const chart = echarts.init(document.getElementById('eplot'), null, {{renderer:'svg'}});
-chart.setOption({option});
-window.addEventListener('resize', () => chart.resize());
-</script>
-""",
-        height=560,
+# ────────────────────────  VIEW + CHART (fragment)  ──────────────────
+# Seul ce bloc est relancé quand on clique un bouton ou change un filtre :
+# navbar, bandeau de logos, titre et CSS ne sont ni recalculés ni renvoyés.
+@st.fragment
+@profiling.fragment("explorer")
+def explorer() -> None:
+    view = st.session_state.view
+
+    # — buttons (centre + no reload) -------------------------------------
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        c1, c2 = st.columns(2, gap="large")
+        if c1.button("Show data by media"):
+            st.session_state.view = "media"
+            view = "media"
+        if c2.button("Show articles over time"):
+            st.session_state.view = "time"
+            view = "time"
+
+    # — description text --------------------------------------------------
+    INTRO = {
+        None: ("We exhaustively collected more than 250 000 news articles since 1978 "
+               "from 20 major Canadian newspapers, extracting full texts and metadata. "
+               "Explore the outlets and their article volume over time."),
+        "media": ("We collected climate‑change articles from 20 outlets representative "
+                  "of the Canadian media landscape and with the largest readership. "
+                  "Below they are ordered by article count."),
+        "time": ("We gathered articles reaching as far back as possible to build a corpus "
+                 "that is both geographically and historically exhaustive across Canada."),
+    }[view]
+
+    delay0 = BASE + 0.40 if view is None else 0.10
+    desc_html = "".join(
+        f'<span class="type-word" style="animation-delay:{delay0+i*STEP:.2f}s">'
+        f'{esc.escape(w)}&nbsp;</span>'
+        for i, w in enumerate(INTRO.split())
     )
+    desc_cls = "db-description alt" if view else "db-description"
+    st.markdown(f'<p class="{desc_cls}">{desc_html}</p>', unsafe_allow_html=True)
+
+    # ────────────────────────  DATA & CHART  ─────────────────────────────
+    if view:
+        from app.components.charts import echarts_chart
+        from app.data.cube import load_cube
+        from app.data.loaders import load_media_counts, load_month_counts
+        from app.data.resample import GRANULARITIES, resample_months
+
+        cube = load_cube()
+        outlets: list[str] = []
+        # conteneur toujours présent → le graphique garde sa position (et
+        # son iframe) quand on passe de « media » à « time »
+        controls = st.container()
+        if view == "time":
+            _, mid, _ = controls.columns([1, 2, 1])
+            granularity = mid.radio(
+                "Granularity", GRANULARITIES, horizontal=True,
+                format_func=str.capitalize, key="granularity",
+                label_visibility="collapsed",
+            )
+            if cube is not None:          # filtres par média : seulement si le cube existe
+                outlets = mid.multiselect("Outlets", cube.outlets, key="outlets",
+                                          placeholder="All outlets")
+                stacked = len(outlets) > 1 and mid.toggle("Stack outlets", key="stacked")
+        chart_title = ("Articles by Media" if view == "media"
+                       else f"Articles per {granularity.capitalize()}")
+        st.markdown(f"<h2 class='db-chart-title'>{chart_title}</h2>",
+                    unsafe_allow_html=True)
+
+        with profiling.section("data"):
+            if view == "media":
+                chart, df, step_ms = "media", load_media_counts(), MEDIA_MS
+            else:
+                # points plafonnés (LTTB) et animation bornée à TIME_BUDGET_MS
+                if outlets:
+                    chart = "stacked" if stacked else "compare"
+                    df = resample_months(cube.frame(outlets), granularity)
+                else:
+                    chart = "time"
+                    df = resample_months(load_month_counts(), granularity)
+                step_ms = max(1, min(TIME_MS, TIME_BUDGET_MS // max(1, len(df))))
+        with profiling.section("chart"):
+            click = echarts_chart(chart, df, key="db_chart",
+                                  axes_wait=AXES_WAIT, step_ms=step_ms)
+
+        # clic sur une barre média → courbe de ce média dans le temps
+        if (click and click["id"] != st.session_state.get("db_click")
+                and view == "media" and cube is not None
+                and click["name"] in cube.outlets):
+            st.session_state.db_click = click["id"]
+            st.session_state.view = "time"
+            st.session_state.outlets = [click["name"]]
+            st.rerun(scope="fragment")
+
+explorer()
+
+profiling.end()
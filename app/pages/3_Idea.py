@@ -4,7 +4,6 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[2]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
-from app.components.ui_utils import hide_sidebar
 # ------------------------------------------------------------------
 
 
@@ -13,9 +12,12 @@ import streamlit as st
 st.set_page_config(page_title="CCF – Idea", page_icon="🌎",
                    layout="centered", initial_sidebar_state="collapsed")
 
-from app.components import navbar
-navbar(active="Idea")  
-hide_sidebar()
+from app.components import navbar, profiling, styles
+profiling.begin("Idea")
+styles.inject("Idea")
+navbar(active="Idea")
 
 st.title("Idea")
 st.write("Content coming soon …")
+
+profiling.end()
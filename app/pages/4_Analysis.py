@@ -18,12 +18,66 @@ st.set_page_config(
 )
 
 # --- 2️⃣  Maintenant on peut utiliser des helpers Streamlit -------
-from app.components.ui_utils import hide_sidebar
-from app.components import navbar
+from app.components import navbar, profiling, styles
+from app.components.charts import echarts_chart
+from app.data.analysis import load_scores
+from app.data.resample import GRANULARITIES
 
-hide_sidebar()          # ← appelle st.markdown → maintenant autorisé
+AXES_WAIT, STEP_MS = 400, 120
+TIME_BUDGET_MS = 3000           # durée max de l’animation des courbes
+
+profiling.begin("Analysis")
+styles.inject("Analysis")
 navbar(active="Analysis")
 
 # --- 3️⃣  Contenu de la page -------------------------------------
 st.title("Analysis")
-st.write("Content coming soon …")
+
+scores = load_scores()
+if scores is None:
+    st.info("Model outputs have not been packed yet (`make analysis`).")
+    profiling.end()
+    st.stop()
+
+st.caption(f"Share of coverage per frame, {len(scores):,} annotated articles.")
+
+
+# --- 4️⃣  Filtres + graphique (fragment : seul ce bloc est relancé) --
+BY = {"Frames": "label", "Outlets": "outlet", "Regions": "region"}
+
+
+@st.fragment
+@profiling.fragment("explorer")
+def explorer() -> None:
+    # filtres dans un conteneur fixe : le graphique garde sa position (et
+    # son iframe) quand le sélecteur de cadre apparaît / disparaît
+    controls = st.container()
+    c1, c2 = controls.columns(2)
+    by = BY[c1.radio("Compare", list(BY), horizontal=True, key="an_by")]
+    granularity = c2.radio("Granularity", GRANULARITIES, index=2, horizontal=True,
+                           format_func=str.capitalize, key="an_granularity")
+    label = None
+    if by != "label":
+        label = controls.selectbox("Frame", scores.labels, key="an_label")
+    outlets = controls.multiselect("Outlets", scores.outlets, key="an_outlets",
+                                   placeholder="All outlets")
+    first = scores.first_month // 12 + 1970
+    last = (scores.first_month + scores.n_months - 1) // 12 + 1970
+    years = (controls.slider("Years", first, last, (first, last), key="an_years")
+             if last > first else None)
+
+    with profiling.section("data"):
+        df = scores.frame(by, label, outlets, years, granularity)
+    step_ms = max(1, min(STEP_MS, TIME_BUDGET_MS // max(1, len(df))))
+    with profiling.section("chart"):
+        echarts_chart("share", df, key="an_chart",
+                      axes_wait=AXES_WAIT, step_ms=step_ms)
+    if by == "label":
+        st.dataframe(scores.overall(outlets).sort_values(ascending=False)
+                     .rename("share of coverage (%)"),
+                     width="stretch")
+
+
+explorer()
+
+profiling.end()
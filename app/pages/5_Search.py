@@ -0,0 +1,80 @@
+# 5_Search.py
+# ────────────────────────────────────────────────────────────────
+import sys
+import html as esc
+from datetime import date
+from pathlib import Path
+
+# --- rendre le projet importable --------------------------------
+ROOT = Path(__file__).resolve().parents[2]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+# --- 1️⃣  PREMIÈRE commande Streamlit ----------------------------
+import streamlit as st
+st.set_page_config(
+    page_title="CCF – Search",
+    page_icon="🌎",
+    layout="centered",
+    initial_sidebar_state="collapsed",
+)
+
+from app.components import navbar, profiling, styles
+from app.data import search
+
+profiling.begin("Search")
+styles.inject("Search")
+navbar(active="Search")
+
+# --- 2️⃣  Formulaire ---------------------------------------------
+st.title("Search")
+
+if not search.available():
+    st.info("The search index has not been built yet (`make index`).")
+    st.stop()
+
+with st.form("search"):
+    q = st.text_input(
+        "Query", placeholder='carbon tax OR "taxe carbone"',
+        help='Words are ANDed; use OR, NOT, "exact phrase" and prefix*.')
+    c1, c2 = st.columns(2)
+    outlets = c1.multiselect("Outlets", search.outlets())
+    period = c2.date_input("Period", (date(1978, 1, 1), date.today()),
+                           min_value=date(1978, 1, 1), max_value=date.today())
+    if st.form_submit_button("Search"):
+        st.session_state["search_page"] = 1
+
+if not q.strip():
+    st.stop()
+
+# --- 3️⃣  Résultats paginés --------------------------------------
+dates = period if isinstance(period, tuple) else (period,)
+start, end = (dates + (None, None))[:2]       # sélection en cours : 1 date
+page = st.session_state.setdefault("search_page", 1)
+try:
+    with profiling.section("query"):
+        total, hits = search.search(q, outlets, start, end, page=page)
+except ValueError:
+    st.error("Invalid query syntax (check quotes and operators).")
+    st.stop()
+
+n_pages = max(1, -(-total // search.PER_PAGE))
+st.caption(f"{total:,} articles · page {page} / {n_pages}")
+
+for hit in hits:
+    st.markdown(
+        f"**{esc.escape(hit.title) or '(untitled)'}**  \n"
+        f"<small>{esc.escape(hit.outlet)} · {hit.day}</small><br>"
+        f"{hit.snippet}",
+        unsafe_allow_html=True,
+    )
+
+prev, _, nxt = st.columns([1, 3, 1])
+if prev.button("← Previous", disabled=page <= 1):
+    st.session_state["search_page"] = page - 1
+    st.rerun()
+if nxt.button("Next →", disabled=page >= n_pages):
+    st.session_state["search_page"] = page + 1
+    st.rerun()
+
+profiling.end()
@@ -5,12 +5,14 @@ Modifier MEDIA_MS ou TIME_MS pour ralentir / accélérer l’animation.
 
 MEDIA_MS : durée (ms) entre deux barres de l’histogramme
 TIME_MS  : durée (ms) entre deux points de la courbe
+
+Nombre de frames fixe (MAX_FRAMES) : chaque frame révèle un bloc de points,
+le HTML reste linéaire en la taille de la série (et non quadratique).
 """
 
 from __future__ import annotations
 import sys
 from pathlib import Path
-import pandas as pd
 import plotly.graph_objects as go
 import plotly.io as pio
 import streamlit as st
@@ -19,13 +21,15 @@ from streamlit.components.v1 import html
 # ╔════════════ Réglages vitesse (ms par frame) ════════════════════╗
 MEDIA_MS = 90     # histogramme (articles par média)
 TIME_MS  = 1     # courbe (articles par mois)
+MAX_FRAMES = 40   # frames par animation, quelle que soit la longueur
 # ╚═════════════════════════════════════════════════════════════════╝
 
 # ─────────────────────────── install context ──────────────────────
-ROOT = Path(__file__).resolve().parents[2]
+ROOT = Path(__file__).resolve().parents[3]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 from app.components import navbar  # noqa: E402
+from app.data.loaders import load_media_counts, load_month_counts  # noqa: E402
 
 st.set_page_config("CCF – Database", "🌎", layout="centered",
                    initial_sidebar_state="collapsed")
@@ -36,27 +40,29 @@ st.markdown(f"<style>{CSS}</style>", unsafe_allow_html=True)
 st.title("Explore the Corpus")
 
 # ─────────────────────────── charge les CSV ───────────────────────
-ASSETS = ROOT / "app" / "static" / "assets"
-media_df = pd.read_csv(ASSETS / "articles_by_media.csv")
-
-month_df = pd.read_csv(ASSETS / "articles_by_month.csv").dropna(subset=["year", "month"])
-month_df["year_month"] = pd.to_datetime(
-    month_df["year"].astype(int).astype(str) + "-" +
-    month_df["month"].astype(int).astype(str).str.zfill(2),
-    format="%Y-%m"
-)
+media_df = load_media_counts()
+month_df = load_month_counts()
 
 # ───────────────────────── utilitaires Plotly ─────────────────────
+def _cuts(n: int) -> list[int]:
+    """Bornes de révélation : min(n, MAX_FRAMES) paliers régulièrement espacés."""
+    k = min(n, MAX_FRAMES)
+    return [round(n * (j + 1) / k) for j in range(k)]
+
+def frame_ms(point_ms: int, n: int) -> int:
+    """Durée d’une frame pour garder point_ms par point au total."""
+    return max(1, round(point_ms * n / max(1, min(n, MAX_FRAMES))))
+
 def frames_bars(x, y):
     return [
         go.Frame(data=[go.Bar(x=x, y=y[:i])])
-        for i in range(1, len(y) + 1)
+        for i in _cuts(len(y))
     ]
 
 def frames_line(x, y):
     return [
         go.Frame(data=[go.Scatter(x=x[:i], y=y[:i], mode="lines")])
-        for i in range(1, len(y) + 1)
+        for i in _cuts(len(y))
     ]
 
 def layout_common(title: str, frame_ms: int):
@@ -111,7 +117,7 @@ if view == "media":
     base = go.Bar(x=x, y=[0] * len(y), marker_line_width=0)
     fig = go.Figure(
         data=[base],
-        layout=layout_common("", MEDIA_MS),
+        layout=layout_common("", frame_ms(MEDIA_MS, len(y))),
         frames=frames_bars(x, y),
     )
     fig.update_yaxes(range=[0, y.max() * 1.05], title="Articles")
@@ -120,13 +126,12 @@ if view == "media":
 # ─────────────────────────── vue TEMPS ─────────────────────────────
 else:
     st.subheader("Articles per Month")
-    df = month_df.sort_values("year_month")
-    x, y = df["year_month"], df["n_articles"]
+    x, y = month_df["year_month"], month_df["n_articles"]
 
     base = go.Scatter(x=[x.min(), x.max()], y=[0, 0], mode="lines")
     fig = go.Figure(
         data=[base],
-        layout=layout_common("", TIME_MS),
+        layout=layout_common("", frame_ms(TIME_MS, len(y))),
         frames=frames_line(x, y),
     )
     fig.update_xaxes(title="Date", tickformat="%Y-%m")
@@ -0,0 +1,178 @@
+"""
+Warm-up – caches préchargés avant la première visite (`make run`)
+----------------------------------------------------------------
+• warm() : dans le process du serveur, avant qu’il n’accepte des
+  connexions : imports lourds (pandas, NumPy, Arrow), images encodées
+  (mêmes tailles que les pages), bundles CSS, agrégats, cube, scores
+  d’analyse ; une étape qui échoue (données absentes) est signalée et
+  n’empêche pas le démarrage
+• `python -m app.warmup [--port 8501] [-- options streamlit]` : warm()
+  puis `streamlit run app/main.py` dans le même process
+• sonde de démarrage à froid : attend /_stcore/health puis rejoue une
+  visite de Home par websocket (app.wsclient ; `websockets` est
+  optionnel, dans requirements-dev.txt : sans lui, seul le temps jusqu’au
+  serveur prêt est mesuré) ; affiche le temps jusqu’au premier rendu de Home et le
+  compare à CCF_COLD_START_BUDGET_MS (3000 ms par défaut) ; une ligne
+  JSON est ajoutée à bench/results.jsonl
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import urllib.request
+from pathlib import Path
+from typing import Callable
+
+T0 = time.perf_counter()
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+MAIN = ROOT / "app/main.py"
+ASSETS = ROOT / "app/static/assets"
+RESULTS = ROOT / "bench/results.jsonl"
+BUDGET_MS = int(os.environ.get("CCF_COLD_START_BUDGET_MS", 3000))
+
+
+# ─────────────────── étapes de préchauffage ───────────────────────────
+def _imports() -> None:
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+    import pyarrow  # noqa: F401
+
+
+def _images() -> None:
+    from app.components.assets import image_src
+    image_src(ASSETS / "CCF_icone.png", width=512)          # Home (fond)
+    image_src(ASSETS / "CCF_icone.png", width=110)          # navbar
+    for fp in sorted((ASSETS / "media").iterdir()):
+        if fp.is_file():
+            image_src(fp, width=80)                         # Home (logos)
+            image_src(fp, height=60)                        # Database (bandeau)
+    for fp in sorted(ASSETS.glob("*.jp*g")):
+        image_src(fp, 128, 128)                             # Home (équipe)
+
+
+def _styles() -> None:
+    from app.components import styles
+    for page in ("Database", "Idea", "Analysis", "Search"):
+        styles.bundle(page)
+
+
+def _aggregates() -> None:
+    from app.data.loaders import load_media_counts, load_month_counts
+    from app.data.resample import GRANULARITIES, resample_months
+    load_media_counts()
+    months = load_month_counts()
+    for granularity in GRANULARITIES:
+        resample_months(months, granularity)
+
+
+def _cube() -> None:
+    from app.data.cube import load_cube
+    load_cube()
+
+
+def _analysis() -> None:
+    from app.data.analysis import load_scores
+    scores = load_scores()
+    if scores is not None:
+        scores.cells()                    # la réduction sur tous les articles
+
+
+STEPS: list[tuple[str, Callable[[], None]]] = [
+    ("imports", _imports), ("images", _images), ("styles", _styles),
+    ("aggregates", _aggregates), ("cube", _cube), ("analysis", _analysis),
+]
+
+
+def warm() -> dict[str, float | str]:
+    """Exécute STEPS ; {étape: ms, ou message d’erreur}."""
+    out: dict[str, float | str] = {}
+    for name, step in STEPS:
+        t0 = time.perf_counter()
+        try:
+            step()
+        except Exception as exc:          # données absentes, etc.
+            out[name] = f"skipped ({type(exc).__name__}: {exc})"
+            continue
+        out[name] = round((time.perf_counter() - t0) * 1e3, 1)
+    return out
+
+
+# ─────────────────── sonde de démarrage à froid ───────────────────────
+def _wait_ready(port: int, timeout: float = 60) -> float | None:
+    url = f"http://localhost:{port}/_stcore/health"
+    end = time.perf_counter() + timeout
+    while time.perf_counter() < end:
+        try:
+            with urllib.request.urlopen(url, timeout=1) as resp:
+                if resp.status == 200:
+                    return time.perf_counter()
+        except OSError:
+            pass
+        time.sleep(.05)
+    return None
+
+
+def _first_home(port: int) -> float | None:
+    """Durée (s) d’une visite de Home par websocket, None sans `websockets`."""
+    from app import wsclient
+    return wsclient.visit(f"ws://localhost:{port}", "Home")
+
+
+def probe(port: int, warm_ms: dict, budget_ms: int = BUDGET_MS) -> dict:
+    ready = _wait_ready(port)
+    if ready is None:
+        print("cold start: server not ready after 60 s")
+        return {}
+    home = _first_home(port)
+    report = dict(mode="cold_start", ts=time.time(), port=port,
+                  warm_ms=warm_ms,
+                  ready_ms=round((ready - T0) * 1e3, 1),
+                  home_ms=round(home * 1e3, 1) if home is not None else None)
+    if home is not None:
+        total = report["ready_ms"] + report["home_ms"]
+        report.update(cold_start_ms=round(total, 1), budget_ms=budget_ms,
+                      within_budget=total <= budget_ms)
+        print(f"cold start: first Home render {total:.0f} ms after launch "
+              f"(server ready {report['ready_ms']:.0f} ms, render "
+              f"{report['home_ms']:.0f} ms) – budget {budget_ms} ms: "
+              + ("OK" if total <= budget_ms else "OVER"))
+    else:
+        print(f"cold start: server ready {report['ready_ms']:.0f} ms after launch; "
+              "first Home render not timed (optional `websockets` is not "
+              "installed, see requirements-dev.txt)")
+    RESULTS.parent.mkdir(parents=True, exist_ok=True)
+    with RESULTS.open("a") as fh:
+        fh.write(json.dumps(report) + "\n")
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Warm caches, then start Streamlit")
+    ap.add_argument("--port", type=int, default=8501)
+    ap.add_argument("--no-probe", action="store_true", help="skip the cold-start probe")
+    ap.add_argument("--budget-ms", type=int, default=BUDGET_MS)
+    args, streamlit_args = ap.parse_known_args(argv)
+
+    timings = warm()
+    for name, ms in timings.items():
+        print(f"  warm-up {name:>10}: {ms}" + (" ms" if isinstance(ms, float) else ""))
+    if not args.no_probe:
+        threading.Thread(target=probe, args=(args.port, timings, args.budget_ms),
+                         daemon=True).start()
+
+    from streamlit.web import cli
+    sys.argv = ["streamlit", "run", str(MAIN), "--server.port", str(args.port),
+                *[a for a in streamlit_args if a != "--"]]
+    return cli.main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
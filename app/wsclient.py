@@ -0,0 +1,62 @@
+"""
+WS client – visites de pages par le websocket de Streamlit
+----------------------------------------------------------
+• un client minimal du protocole BackMsg/ForwardMsg : demande le rendu
+  d’une page puis attend « script_finished » ; durée par visite
+• partagé par la sonde de démarrage à froid (app.warmup) et par
+  `make bench --mode ws` (bench.sessions)
+• `websockets` est optionnel (requirements-dev.txt) : available() dit
+  s’il est installé ; sans lui, les appelants sautent la mesure
+"""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+def available() -> bool:
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+async def session(url: str, pages: list[str], visits: int,
+                  latencies: list[float],
+                  hold: threading.Event | None = None) -> None:
+    """Visite *visits* fois les *pages* (en boucle) sur une même connexion.
+
+    Chaque durée (s) est ajoutée à *latencies* ; avec *hold*, la session
+    reste ouverte jusqu’à ce que l’événement soit posé.
+    """
+    import websockets
+    from streamlit.proto.BackMsg_pb2 import BackMsg
+    from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+
+    async with websockets.connect(f"{url.rstrip('/')}/_stcore/stream",
+                                  subprotocols=["streamlit"],
+                                  max_size=None) as ws:
+        for i in range(visits):
+            msg = BackMsg()
+            msg.rerun_script.query_string = ""
+            msg.rerun_script.page_name = pages[i % len(pages)]
+            t0 = time.perf_counter()
+            await ws.send(msg.SerializeToString())
+            while True:
+                fwd = ForwardMsg.FromString(await ws.recv())
+                if fwd.WhichOneof("type") == "script_finished":
+                    break
+            latencies.append(time.perf_counter() - t0)
+        if hold is not None:
+            await asyncio.to_thread(hold.wait)
+
+
+def visit(url: str, page: str) -> float | None:
+    """Durée (s) d’une visite de *page*, None sans `websockets`."""
+    if not available():
+        return None
+    latencies: list[float] = []
+    asyncio.run(session(url, [page], 1, latencies))
+    return latencies[0] if latencies else None
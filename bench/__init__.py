@@ -0,0 +1,5 @@
+"""
+bench package
+-------------
+Mesures de charge de l’app (hors production) : `make bench`.
+"""
@@ -0,0 +1,150 @@
+"""
+Benchmark – sessions Streamlit concurrentes (`make bench`)
+---------------------------------------------------------
+Deux modes, même rapport (reruns/s, latence p50/p99, RSS par session) :
+
+• apptest (défaut) : N sessions AppTest dans ce process, chacune visite
+  Home puis Database et bascule « media » ↔ « time » --toggles fois
+• ws : N clients websocket contre un serveur déjà lancé (--url) ; chaque
+  client rejoue des visites de pages (Home, Database) via le protocole
+  BackMsg/ForwardMsg de Streamlit (app.wsclient). --pid = PID du serveur
+  pour la RSS. (`websockets`, dans requirements-dev.txt)
+
+    python -m bench.sessions --sessions 8 --toggles 5
+    python -m bench.sessions --mode ws --url ws://localhost:8501 --pid 1234
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app import wsclient  # noqa: E402
+
+PAGES = ROOT / "app/pages"
+
+
+def rss_mb(pid: int | str = "self") -> float:
+    """RSS courante (Linux /proc) en Mo."""
+    for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if line.startswith("VmRSS:"):
+            return int(line.split()[1]) / 1024
+    return float("nan")
+
+
+def report(latencies: list[float], elapsed: float, sessions: int,
+           rss_before: float, rss_after: float) -> dict:
+    lat = sorted(latencies)
+    return dict(
+        sessions=sessions, reruns=len(lat),
+        reruns_per_s=round(len(lat) / elapsed, 2),
+        p50_ms=round(statistics.median(lat) * 1e3, 1),
+        p99_ms=round(lat[min(len(lat) - 1, int(len(lat) * .99))] * 1e3, 1),
+        rss_mb=round(rss_after, 1),
+        rss_per_session_mb=round((rss_after - rss_before) / sessions, 2),
+    )
+
+
+# ─────────────────── mode AppTest ─────────────────────────────────────
+def _apptest_session(toggles: int, timeout: float) -> list[float]:
+    from streamlit.testing.v1 import AppTest
+
+    out: list[float] = []
+
+    def timed(run):
+        t0 = time.perf_counter()
+        at = run()
+        out.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return at
+
+    timed(lambda: AppTest.from_file(str(PAGES / "1_Home.py"),
+                                    default_timeout=timeout).run())
+    db = AppTest.from_file(str(PAGES / "2_Database.py"), default_timeout=timeout)
+    timed(db.run)
+    for i in range(toggles):
+        label = "Show data by media" if i % 2 == 0 else "Show articles over time"
+        button = next(b for b in db.button if b.label == label)
+        timed(button.click().run)
+    return out
+
+
+def run_apptest(sessions: int, toggles: int, timeout: float) -> dict:
+    os.chdir(ROOT)                        # .streamlit/config.toml
+    rss_before = rss_mb()
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as pool:
+        results = list(pool.map(lambda _: _apptest_session(toggles, timeout),
+                                range(sessions)))
+    elapsed = time.perf_counter() - t0
+    return report([x for r in results for x in r], elapsed, sessions,
+                  rss_before, rss_mb())
+
+
+# ─────────────────── mode websocket ───────────────────────────────────
+async def _ws_all(url: str, sessions: int, visits: int, latencies: list[float],
+                  ready: threading.Event) -> None:
+    pages = ["Home", "Database"]
+    await asyncio.gather(*(wsclient.session(url, pages, visits, latencies, ready)
+                           for _ in range(sessions)))
+
+
+def run_ws(url: str, pid: int | None, sessions: int, visits: int) -> dict:
+    rss_before = rss_mb(pid) if pid else float("nan")
+    latencies: list[float] = []
+    ready = threading.Event()
+    t0 = time.perf_counter()
+    runner = threading.Thread(
+        target=asyncio.run, args=(_ws_all(url, sessions, visits, latencies, ready),))
+    runner.start()
+    while len(latencies) < sessions * visits and runner.is_alive():
+        time.sleep(.05)
+    elapsed = time.perf_counter() - t0
+    rss_after = rss_mb(pid) if pid else float("nan")   # sessions encore ouvertes
+    ready.set()
+    runner.join()
+    return report(latencies, elapsed, sessions, rss_before, rss_after)
+
+
+def main(argv: list[str] | None = None) -> dict:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--mode", choices=("apptest", "ws"), default="apptest")
+    ap.add_argument("--sessions", type=int, default=8)
+    ap.add_argument("--toggles", type=int, default=5, help="apptest: view toggles")
+    ap.add_argument("--visits", type=int, default=10, help="ws: page visits")
+    ap.add_argument("--url", default="ws://localhost:8501")
+    ap.add_argument("--pid", type=int, help="ws: PID du serveur (RSS)")
+    ap.add_argument("--timeout", type=float, default=30)
+    ap.add_argument("--json", type=Path, help="ajoute le rapport (JSON lines)")
+    args = ap.parse_args(argv)
+
+    if args.mode == "apptest":
+        result = run_apptest(args.sessions, args.toggles, args.timeout)
+    else:
+        if not wsclient.available():
+            sys.exit("--mode ws needs `websockets` (pip install -r requirements-dev.txt)")
+        result = run_ws(args.url, args.pid, args.sessions, args.visits)
+    result = dict(mode=args.mode, ts=time.time(), **result)
+
+    for k, v in result.items():
+        print(f"{k:>20}: {v}")
+    if args.json:
+        with args.json.open("a") as fh:
+            fh.write(json.dumps(result) + "\n")
+    return result
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Workers – plusieurs process Streamlit derrière nginx (`make run WORKERS=n`)
+--------------------------------------------------------------------------
+• n serveurs Streamlit sur BASE_PORT … BASE_PORT+n-1, en mode
+  CCF_ASSET_MODE=url : aucune image encodée en mémoire dans les workers,
+  nginx pose le cache immuable des copies hachées (`make assets`)
+• chaque worker passe par app.warmup : caches préchauffés avant
+  d’accepter des connexions, temps de démarrage à froid affiché
+• nginx (deploy/nginx.conf, upstream ré-écrit) en ip_hash : un navigateur
+  reste sur le même worker (session, fichiers média, iframes)
+• les données lourdes sont lues en mmap depuis data/processed
+  (cube .npy, articles_meta.arrow) : pages partagées, RAM ~constante en n
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+TEMPLATE = ROOT / "deploy/nginx.conf"
+BASE_PORT = 8501
+
+
+def nginx_conf(ports: list[int], listen: int, prefix: Path) -> str:
+    servers = "".join(f"        server 127.0.0.1:{p};\n" for p in ports)
+    conf = TEMPLATE.read_text()
+    conf = re.sub(r"upstream streamlit \{.*?\}",
+                  "upstream streamlit {\n        ip_hash;\n" + servers + "    }",
+                  conf, flags=re.S)
+    conf = re.sub(r"listen \d+;", f"listen {listen};", conf)
+    # nginx lancé hors /etc : pid et logs dans le préfixe temporaire
+    return (f"pid {prefix}/nginx.pid;\nerror_log stderr;\n"
+            + conf.replace("http {", "http {\n    access_log off;", 1))
+
+
+def main(argv: list[str] | None = None) -> int:
+    ap = argparse.ArgumentParser(description="Streamlit workers behind nginx")
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 2)
+    ap.add_argument("--port", type=int, default=8080, help="port public (nginx)")
+    args = ap.parse_args(argv)
+
+    nginx = shutil.which("nginx")
+    if nginx is None:
+        sys.exit("nginx not found: install it or run with WORKERS=1")
+
+    env = os.environ | {"PYTHONPATH": str(ROOT), "CCF_ASSET_MODE": "url"}
+    ports = [BASE_PORT + i for i in range(args.workers)]
+    procs = [subprocess.Popen(
+        [sys.executable, "-m", "app.warmup", "--port", str(p),
+         "--server.headless", "true"],
+        cwd=ROOT, env=env) for p in ports]
+
+    prefix = Path(tempfile.mkdtemp(prefix="ccf-nginx-"))
+    conf = prefix / "nginx.conf"
+    conf.write_text(nginx_conf(ports, args.port, prefix))
+    procs.append(subprocess.Popen(
+        [nginx, "-p", str(prefix), "-c", str(conf), "-e", "stderr",
+         "-g", "daemon off;"]))
+    print(f"{args.workers} workers on {ports[0]}–{ports[-1]}, "
+          f"nginx on http://localhost:{args.port}")
+
+    def stop(*_):
+        for p in procs:
+            p.terminate()
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    try:
+        os.wait()                         # un process qui meurt arrête tout
+    finally:
+        stop()
+        for p in procs:
+            p.wait()
+        shutil.rmtree(prefix, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,11 @@
+// Bundle ECharts limité à ce que les pages utilisent (make echarts).
+// Ajouter ici tout nouveau type de série / composant avant de l’utiliser.
+import * as echarts from 'echarts/core';
+import { BarChart, LineChart } from 'echarts/charts';
+import { GridComponent, LegendComponent, TooltipComponent } from 'echarts/components';
+import { SVGRenderer } from 'echarts/renderers';
+
+echarts.use([BarChart, LineChart, GridComponent, LegendComponent, TooltipComponent,
+             SVGRenderer]);
+
+export * from 'echarts/core';
@@ -0,0 +1,6 @@
+"""
+pipeline package
+----------------
+Étapes hors ligne (lancées par le Makefile, jamais par Streamlit) :
+les pages ne lisent que ce qu’elles produisent.
+"""
@@ -0,0 +1,69 @@
+"""
+Analysis build – `make analysis`
+--------------------------------
+• lit les sorties de modèle par article : data/processed/annotations/
+  (Parquet partitionné outlet=…/year=… comme le corpus, colonne id + une
+  colonne float par cadre / sujet)
+• joint les métadonnées du corpus sur (id, média, année) : les ids ne
+  sont uniques qu’à l’intérieur d’un média (ids des dumps bruts)
+• trie par (média, mois) → scores.npy float32 + offsets.npy + dims.json
+  (format lu par app.data.analysis), publiés ensemble (app.data.snapshot)
+"""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data import corpus, snapshot  # noqa: E402
+from app.data.analysis import ANALYSIS_DIR  # noqa: E402
+
+ANNOTATIONS_DIR = corpus.PROCESSED / "annotations"
+
+
+def label_columns(schema: pa.Schema) -> list[str]:
+    return [f.name for f in schema
+            if f.name != "id" and pa.types.is_floating(f.type)]
+
+
+def build(source: Path = ANNOTATIONS_DIR) -> tuple[int, ...]:
+    if not any(source.rglob("*.parquet")):
+        sys.exit(f"no annotations in {source} (run `make annotate`)")
+    keys = ["id", "outlet", "year"]
+    notes = ds.dataset(source, format="parquet", partitioning=corpus.PARTITIONING)
+    labels = label_columns(notes.schema)
+    scores = notes.to_table(columns=keys + labels)
+    meta = corpus.scan(keys + ["month"])
+    table = scores.join(meta, keys, join_type="inner")
+
+    outlets = sorted(pc.unique(table["outlet"]).to_pylist())
+    outlet = pc.index_in(table["outlet"], pa.array(outlets)).to_numpy()
+    month = ((table["year"].to_numpy().astype(np.int64) - 1970) * 12
+             + table["month"].to_numpy().astype(np.int64) - 1)
+    first = int(month.min())
+    n_months = int(month.max()) - first + 1
+
+    cell = outlet.astype(np.int64) * n_months + (month - first)
+    order = np.argsort(cell, kind="stable")
+    matrix = np.empty((len(order), len(labels)), dtype=np.float32)
+    for j, name in enumerate(labels):     # colonne par colonne : pas de copie pandas
+        matrix[:, j] = pc.fill_null(table[name], 0.0).to_numpy()[order]
+    offsets = np.zeros(len(outlets) * n_months + 1, dtype=np.int64)
+    np.cumsum(np.bincount(cell, minlength=len(outlets) * n_months), out=offsets[1:])
+
+    snapshot.publish(ANALYSIS_DIR, {"scores": matrix, "offsets": offsets},
+                     dict(labels=labels, outlets=outlets,
+                          first_month=first, n_months=n_months))
+    return matrix.shape
+
+
+if __name__ == "__main__":
+    print(f"scores {build()} → {snapshot.current(ANALYSIS_DIR)}")
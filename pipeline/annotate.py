@@ -0,0 +1,247 @@
+"""
+Annotation – `make annotate`
+----------------------------
+• inférence hors ligne, CPU seulement : chaque partition du corpus
+  (média × année) est lue par lots de CHUNK_ROWS articles et passée au
+  classifieur ; jamais plus d’un lot de textes en mémoire par worker
+• un process par partition en cours (ProcessPoolExecutor, CCF_WORKERS) ;
+  au plus 2 × WORKERS partitions en vol : file bornée, mémoire bornée
+• sortie colonnaire : data/processed/annotations/outlet=…/year=…/part-0.parquet
+  (id + une colonne float32 par cadre), lue par `make analysis`
+• reprise : _checkpoint.json garde, par partition terminée, l’empreinte
+  de ses fichiers source et la version du classifieur ; seules les
+  partitions nouvelles, modifiées ou annotées par un autre modèle sont
+  relancées (`make annotate FULL=1` pour tout refaire)
+• classifieur interchangeable : CCF_CLASSIFIER=module:Classe (défaut :
+  LexiconClassifier, lexiques FR/EN) ; il expose labels, version et
+  predict(titles, texts) -> ndarray float32 (n, len(labels))
+• aucune partition relancée ni retirée : pas de nouveau snapshot d’analyse
+• rapport final : articles/s et articles/s par cœur (temps CPU des workers)
+"""
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Protocol, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data import corpus, snapshot  # noqa: E402
+from pipeline import analysis  # noqa: E402
+
+OUT_DIR = analysis.ANNOTATIONS_DIR
+CHECKPOINT = OUT_DIR / "_checkpoint.json"
+CHUNK_ROWS = int(os.environ.get("CCF_CHUNK_ROWS", 2_000))
+WORKERS = int(os.environ.get("CCF_WORKERS", os.cpu_count() or 1))
+CLASSIFIER = os.environ.get("CCF_CLASSIFIER", "pipeline.annotate:LexiconClassifier")
+
+
+# ─────────────────── classifieurs ─────────────────────────────────────
+class Classifier(Protocol):
+    labels: list[str]
+    version: str
+
+    def predict(self, titles: Sequence[str], texts: Sequence[str]) -> np.ndarray: ...
+
+
+# cadres médiatiques du changement climatique, racines EN + FR
+FRAMES: dict[str, list[str]] = {
+    "economy": ["econom", "job", "emploi", "cost", "coût", "tax", "taxe",
+                "price", "prix", "market", "marché", "invest"],
+    "health": ["health", "santé", "disease", "maladie", "heat wave",
+               "canicule", "hospital", "hôpital", "mortal"],
+    "security": ["security", "sécurité", "military", "militaire", "conflict",
+                 "conflit", "migra", "refugee", "réfugié"],
+    "justice": ["justice", "equit", "équit", "indigenous", "autochtone",
+                "inequal", "inégal", "rights", "droits"],
+    "politics": ["parliament", "parlement", "minister", "ministre", "election",
+                 "élection", "party", "parti", "policy", "politique"],
+    "science": ["scien", "research", "recherche", "study", "étude",
+                "ipcc", "giec", "model", "modèle", "data"],
+    "environment": ["ecosystem", "écosystème", "biodivers", "species",
+                    "espèce", "forest", "forêt", "ocean", "océan", "glacier"],
+    "technology": ["technolog", "renewable", "renouvelable", "solar", "solaire",
+                   "wind", "éolien", "electric", "électrique", "carbon capture",
+                   "captage"],
+    "disaster": ["flood", "inondation", "wildfire", "feu de forêt", "storm",
+                 "tempête", "drought", "sécheresse", "hurricane", "ouragan"],
+}
+
+
+class LexiconClassifier:
+    """Base de référence : densité de mots-clés → probabilité par cadre.
+
+    p = 1 − exp(−occurrences / SCALE) sur titre (poids TITLE_WEIGHT) + texte.
+    """
+    SCALE = 3.0
+    TITLE_WEIGHT = 3
+
+    def __init__(self, frames: dict[str, list[str]] = FRAMES) -> None:
+        self.labels = list(frames)
+        self._patterns = [
+            re.compile(r"\b(?:" + "|".join(map(re.escape, stems)) + ")", re.I)
+            for stems in frames.values()]
+        digest = hashlib.sha1(json.dumps(frames, sort_keys=True).encode()).hexdigest()
+        self.version = f"lexicon-{digest[:8]}"
+
+    def predict(self, titles: Sequence[str], texts: Sequence[str]) -> np.ndarray:
+        titles = pd.Series(titles, dtype=object).fillna("")
+        texts = pd.Series(texts, dtype=object).fillna("")
+        hits = np.empty((len(texts), len(self.labels)), dtype=np.float32)
+        for j, pat in enumerate(self._patterns):
+            hits[:, j] = (self.TITLE_WEIGHT * titles.str.count(pat)
+                          + texts.str.count(pat))
+        return -np.expm1(-hits / self.SCALE)
+
+
+def load_classifier(spec: str = CLASSIFIER) -> Classifier:
+    module, _, name = spec.partition(":")
+    return getattr(importlib.import_module(module), name)()
+
+
+# ─────────────────── worker ───────────────────────────────────────────
+_model: Classifier | None = None
+
+
+def _init(spec: str) -> None:
+    global _model
+    _model = load_classifier(spec)
+
+
+def annotate_partition(outlet: str, year: int) -> tuple[str, int, int, float]:
+    """Worker : (média, année, articles annotés, secondes CPU)."""
+    cpu0 = time.process_time()
+    scanner = corpus.dataset().scanner(
+        columns=["id", "title", "text"], batch_size=CHUNK_ROWS,
+        filter=(pc.field("outlet") == outlet) & (pc.field("year") == year))
+    schema = pa.schema([("id", pa.string())]
+                       + [(lab, pa.float32()) for lab in _model.labels])
+    dst = _part_dir(outlet, year) / "part-0.parquet"
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(".part-0.parquet.tmp")   # « . » : ignoré par les scans
+    n = 0
+    with pq.ParquetWriter(tmp, schema, compression="zstd") as writer:
+        for batch in scanner.to_batches():
+            if not batch.num_rows:
+                continue
+            probs = _model.predict(batch.column("title").to_pylist(),
+                                   batch.column("text").to_pylist())
+            cols = np.ascontiguousarray(probs.T, dtype=np.float32)
+            writer.write_table(pa.Table.from_arrays(
+                [batch.column("id")] + [pa.array(c) for c in cols], schema=schema))
+            n += batch.num_rows
+    os.replace(tmp, dst)
+    return outlet, year, n, time.process_time() - cpu0
+
+
+# ─────────────────── partitions & checkpoint ──────────────────────────
+def _part_dir(outlet: str, year: int) -> Path:
+    return OUT_DIR / f"outlet={outlet}" / f"year={year}"
+
+
+def partitions() -> dict[tuple[str, int], str]:
+    """(média, année) → empreinte des fichiers Parquet source."""
+    files: dict[tuple[str, int], list[str]] = {}
+    for frag in corpus.dataset().get_fragments():
+        keys = ds.get_partition_keys(frag.partition_expression)
+        st = os.stat(frag.path)
+        files.setdefault((keys["outlet"], int(keys["year"])), []).append(
+            f"{Path(frag.path).name}:{st.st_size}:{st.st_mtime_ns}")
+    return {k: hashlib.sha1("|".join(sorted(v)).encode()).hexdigest()[:16]
+            for k, v in files.items()}
+
+
+def load_checkpoint() -> dict[str, dict]:
+    return json.loads(CHECKPOINT.read_text()) if CHECKPOINT.exists() else {}
+
+
+def save_checkpoint(done: dict[str, dict]) -> None:
+    tmp = CHECKPOINT.with_suffix(".tmp")
+    tmp.write_text(json.dumps(done, indent=1, sort_keys=True))
+    os.replace(tmp, CHECKPOINT)
+
+
+def run(workers: int = WORKERS, spec: str = CLASSIFIER, full: bool = False) -> dict:
+    if full:
+        shutil.rmtree(OUT_DIR, ignore_errors=True)
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    model = load_classifier(spec)
+    done = load_checkpoint()
+    source = partitions()
+
+    # partitions disparues du corpus : on retire leurs annotations
+    removed = 0
+    for key in list(done):
+        outlet, year = done[key]["outlet"], done[key]["year"]
+        if (outlet, year) not in source:
+            shutil.rmtree(_part_dir(outlet, year), ignore_errors=True)
+            del done[key]
+            removed += 1
+    todo = [(o, y) for (o, y), fp in sorted(source.items())
+            if done.get(f"{o}/{y}", {}).get("fingerprint") != fp
+            or done[f"{o}/{y}"].get("model") != model.version]
+    print(f"{model.version}: {len(todo)} / {len(source)} partitions to annotate")
+
+    n_total, cpu_total = 0, 0.0
+    t0 = time.perf_counter()
+    if todo:
+        n_workers = min(workers, len(todo))
+        pending = iter(todo)
+        with ProcessPoolExecutor(max_workers=n_workers, initializer=_init,
+                                 initargs=(spec,)) as pool:
+            running = set()
+            while True:
+                # file bornée : au plus 2 partitions par worker soumises
+                while len(running) < 2 * n_workers:
+                    nxt = next(pending, None)
+                    if nxt is None:
+                        break
+                    running.add(pool.submit(annotate_partition, *nxt))
+                if not running:
+                    break
+                finished, running = wait(running, return_when=FIRST_COMPLETED)
+                for job in finished:
+                    outlet, year, n, cpu = job.result()
+                    n_total += n
+                    cpu_total += cpu
+                    done[f"{outlet}/{year}"] = dict(
+                        outlet=outlet, year=year, n=n,
+                        fingerprint=source[(outlet, year)], model=model.version)
+                    save_checkpoint(done)   # reprise possible après interruption
+    elapsed = time.perf_counter() - t0
+    save_checkpoint(done)
+
+    report = dict(model=model.version, partitions=len(todo), articles=n_total,
+                  seconds=round(elapsed, 1),
+                  articles_per_s=round(n_total / elapsed, 1) if elapsed else 0.0,
+                  articles_per_s_per_core=round(n_total / cpu_total, 1) if cpu_total else 0.0)
+    # rien de neuf : le snapshot courant reste publié (ni CURRENT ni les
+    # KEEP versions gardées ne bougent)
+    if not todo and not removed and snapshot.current(analysis.ANALYSIS_DIR):
+        return report
+    if any(OUT_DIR.rglob("*.parquet")):
+        report["matrix"] = analysis.build(OUT_DIR)
+    return report
+
+
+if __name__ == "__main__":
+    result = run(full=os.environ.get("FULL", "") not in ("", "0"))
+    for k, v in result.items():
+        print(f"{k:>24}: {v}")
@@ -0,0 +1,79 @@
+"""
+Cube build – `make cube` (appelé aussi en fin de `make data`)
+-------------------------------------------------------------
+• comptes outlet × mois × langue sommés depuis le manifest d’ingestion
+  (clé « cube » de chaque dump, tenue à jour par pipeline.ingest) :
+  coût proportionnel au nombre de dumps, pas à la taille du corpus
+• manifest absent ou antérieur à cette clé : un seul group-by
+  outlet × year × month × language sur le corpus
+• matrice dense int32 + dims.json publiés ensemble (app.data.snapshot)
+"""
+from __future__ import annotations
+
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data import corpus, snapshot  # noqa: E402
+from app.data.cube import CUBE_DIR  # noqa: E402
+
+COLUMNS = ["outlet", "year", "month", "language", "n_articles"]
+
+
+def cell(outlet: str, year: int, month: int, language: str) -> str:
+    """Clé d’une cellule du cube dans le manifest : « média|aaaa-mm|langue »."""
+    return f"{outlet}|{year}-{month:02d}|{language}"
+
+
+def from_manifest(manifest: dict[str, dict]) -> pd.DataFrame | None:
+    """Comptes sommés sur les dumps, None si un dump n’a pas de clé « cube »."""
+    if not manifest or any("cube" not in e for e in manifest.values()):
+        return None
+    total: Counter = Counter()
+    for entry in manifest.values():
+        total.update(entry["cube"])
+    rows = []
+    for k, n in total.items():
+        outlet, ym, language = k.split("|")
+        rows.append((outlet, int(ym[:4]), int(ym[5:]), language, n))
+    return pd.DataFrame(rows, columns=COLUMNS)
+
+
+def _load_manifest() -> dict[str, dict]:
+    return json.loads(corpus.MANIFEST.read_text()) if corpus.MANIFEST.exists() else {}
+
+
+def build(manifest: dict[str, dict] | None = None) -> tuple[int, ...]:
+    df = from_manifest(_load_manifest() if manifest is None else manifest)
+    if df is None:
+        df = corpus.query(["outlet", "year", "month", "language"])
+    if df.empty:
+        raise ValueError("empty corpus: nothing to put in the cube")
+    outlets = sorted(df["outlet"].unique())
+    languages = sorted(df["language"].astype(str).unique())
+    months = (df["year"].to_numpy(np.int64) - 1970) * 12 + df["month"].to_numpy(np.int64) - 1
+    first = int(months.min())
+
+    counts = np.zeros((len(outlets), int(months.max()) - first + 1, len(languages)),
+                      dtype=np.int32)
+    np.add.at(counts,
+              (pd.Categorical(df["outlet"], categories=outlets).codes,
+               months - first,
+               pd.Categorical(df["language"].astype(str), categories=languages).codes),
+              df["n_articles"].to_numpy(np.int32))
+
+    snapshot.publish(CUBE_DIR, {"counts": counts},
+                     dict(outlets=outlets, languages=languages, first_month=first))
+    return counts.shape
+
+
+if __name__ == "__main__":
+    print(f"cube {build()} → {snapshot.current(CUBE_DIR)}")
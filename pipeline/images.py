@@ -0,0 +1,141 @@
+"""
+Image optimisation – `make assets`
+----------------------------------
+• redimensionne photos et logos de app/static/assets en variantes WebP
+  (et AVIF si Pillow le gère) dans app/static/assets/generated/
+• une variante par boîte BOXES (côté max, jamais d’agrandissement)
+• logos de media/ : en plus, une variante par hauteur BANNER_HEIGHTS
+  (× DPR) — un logo très large affiché en bandeau (height=60) n’a sinon
+  aucune boîte assez haute et part en taille originale
+• manifest.json : dimensions + sha256 de la source et de chaque variante ;
+  une source inchangée n’est pas ré-encodée
+• copies à nom haché (app/static/assets/hashed/, mode CCF_ASSET_MODE=url)
+  de chaque source et variante : l’app ne fait que les chercher
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import sys
+from pathlib import Path
+
+from PIL import Image, ImageOps, features
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.components.assets import (  # noqa: E402
+    ASSETS_DIR, DPR, GENERATED_DIR, HASHED_DIR, MANIFEST, hashed_name)
+
+BOXES = (128, 256, 512, 1024)            # côté max (px) des variantes
+BANNER_HEIGHTS = (60,)                   # hauteur CSS (px) des bandeaux de logos
+BANNER_DIR = "media/"
+QUALITY = dict(webp=80, avif=60)
+SOURCES = {".png", ".jpg", ".jpeg", ".webp"}
+VERSION = 2                              # 2 : variantes par hauteur (bandeaux)
+
+
+def _sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _formats() -> list[str]:
+    return ["webp"] + (["avif"] if features.check("avif") else [])
+
+
+def _variants(src: Path, rel: str, formats: list[str]) -> list[dict]:
+    out: list[dict] = []
+    with Image.open(src) as im:
+        im = ImageOps.exif_transpose(im)
+        im = im.convert("RGBA" if "A" in im.getbands() or "transparency" in im.info
+                        else "RGB")
+        stem = rel.rsplit(".", 1)[0].replace("/", "__").replace(" ", "_")
+        sizes: list[tuple[str, tuple[int, int]]] = []
+        for box in BOXES:
+            if box > max(im.size) and box != BOXES[0]:
+                break                    # pas d’agrandissement
+            sizes.append((str(box), (box, box)))
+        if rel.startswith(BANNER_DIR):
+            for h in BANNER_HEIGHTS:
+                if h * DPR < im.height:  # pas d’agrandissement
+                    sizes.append((f"h{h * DPR}", (im.width, h * DPR)))
+        for tag, box in sizes:
+            thumb = im.copy()
+            thumb.thumbnail(box, Image.LANCZOS)
+            for fmt in formats:
+                dst = GENERATED_DIR / f"{stem}.{tag}.{fmt}"
+                thumb.save(dst, fmt.upper(), quality=QUALITY[fmt], method=6)
+                out.append(dict(path=dst.relative_to(ASSETS_DIR).as_posix(),
+                                format=fmt, width=thumb.width,
+                                height=thumb.height, bytes=dst.stat().st_size,
+                                sha256=_sha256(dst)))
+    return out
+
+
+def _hashed(files: dict[Path, str]) -> None:
+    """Copies <nom>.<sha12><ext> (lien dur si possible) ; orphelines supprimées."""
+    HASHED_DIR.mkdir(parents=True, exist_ok=True)
+    keep = set()
+    for src, digest in files.items():
+        dst = HASHED_DIR / hashed_name(src, digest)
+        keep.add(dst.name)
+        if dst.exists():
+            continue
+        tmp = dst.with_name(f".{dst.name}.{os.getpid()}.tmp")
+        try:
+            os.link(src, tmp)
+        except OSError:
+            shutil.copyfile(src, tmp)
+        os.replace(tmp, dst)
+    for fp in HASHED_DIR.iterdir():
+        if fp.is_file() and fp.name not in keep:
+            fp.unlink()
+
+
+def build() -> dict:
+    GENERATED_DIR.mkdir(parents=True, exist_ok=True)
+    old = json.loads(MANIFEST.read_text()).get("sources", {}) if MANIFEST.exists() else {}
+    formats = _formats()
+    sources: dict[str, dict] = {}
+
+    for src in sorted(ASSETS_DIR.rglob("*")):
+        if (not src.is_file() or src.suffix.lower() not in SOURCES
+                or GENERATED_DIR in src.parents or HASHED_DIR in src.parents):
+            continue
+        rel = src.relative_to(ASSETS_DIR).as_posix()
+        digest = _sha256(src)
+        prev = old.get(rel)
+        if (prev and prev["sha256"] == digest and prev.get("formats") == formats
+                and prev.get("version") == VERSION
+                and all((ASSETS_DIR / v["path"]).exists() for v in prev["variants"])):
+            sources[rel] = prev
+            continue
+        with Image.open(src) as im:
+            width, height = im.size
+        sources[rel] = dict(sha256=digest, version=VERSION, width=width, height=height,
+                            bytes=src.stat().st_size, formats=formats,
+                            variants=_variants(src, rel, formats))
+        print(f"  {rel}: {len(sources[rel]['variants'])} variants")
+
+    # variantes orphelines (source supprimée ou renommée)
+    keep = {v["path"] for s in sources.values() for v in s["variants"]}
+    for fp in GENERATED_DIR.iterdir():
+        if (fp.is_file() and fp != MANIFEST
+                and fp.relative_to(ASSETS_DIR).as_posix() not in keep):
+            fp.unlink()
+
+    manifest = dict(version=VERSION, sources=sources)
+    MANIFEST.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    _hashed({**{ASSETS_DIR / rel: s["sha256"] for rel, s in sources.items()},
+             **{ASSETS_DIR / v["path"]: v["sha256"]
+                for s in sources.values() for v in s["variants"]}})
+    return manifest
+
+
+if __name__ == "__main__":
+    m = build()
+    before = sum(s["bytes"] for s in m["sources"].values())
+    print(f"{len(m['sources'])} sources ({before / 1e6:.1f} MB) → {MANIFEST}")
@@ -0,0 +1,287 @@
+"""
+Ingestion – `make data`
+-----------------------
+• lit les dumps bruts data/raw/<média>/*.jsonl|*.csv (.gz accepté) par
+  morceaux de CHUNK_ROWS lignes : mémoire ≈ CHUNK_ROWS × WORKERS articles
+• normalise noms de médias, dates (jour local tel qu’écrit, formats
+  mélangés → year/month entiers), langue, n_words
+• écrit le corpus Parquet partitionné (app.data.corpus) puis les agrégats
+  propres (plus de « 1978.0 » dans les CSV)
+• un process par média (ProcessPoolExecutor, CCF_WORKERS, défaut = nb de cœurs)
+• incrémental : _manifest.json garde, par dump brut, son empreinte
+  (taille + mtime), ses fichiers Parquet et ses comptes média / mois /
+  média × mois × langue ; seuls les dumps nouveaux ou modifiés sont
+  relus, les agrégats sont la somme des comptes du manifest (`make data
+  FULL=1` pour tout refaire)
+• reconstruit ensuite le cube média × mois × langue (pipeline.cube) à
+  partir de ces mêmes comptes, sans relire le corpus
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+import unicodedata
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Iterator
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data import corpus  # noqa: E402
+from pipeline import cube  # noqa: E402
+
+RAW_DIR = ROOT / "data/raw"
+MANIFEST = corpus.MANIFEST
+CHUNK_ROWS = int(os.environ.get("CCF_CHUNK_ROWS", 20_000))
+WORKERS = int(os.environ.get("CCF_WORKERS", os.cpu_count() or 1))
+
+OUTLETS = [
+    "Toronto Star", "Globe and Mail", "National Post", "Calgary Herald",
+    "Edmonton Journal", "Vancouver Sun", "Le Devoir", "Winnipeg Free Press",
+    "Times Colonist", "Chronicle Herald", "Montreal Gazette", "La Presse Plus",
+    "Star Phoenix", "Whitehorse Daily Star", "La Presse", "The Telegram",
+    "Journal de Montreal", "Acadie Nouvelle", "Le Droit", "Toronto Sun",
+]
+# variantes rencontrées dans les dumps → nom canonique (clé normalisée)
+ALIASES = {
+    "saskatoonstarphoenix": "Star Phoenix",
+    "whitehorsestar": "Whitehorse Daily Star",
+    "gazette": "Montreal Gazette",
+    "lacadienouvelle": "Acadie Nouvelle",
+    "halifaxchronicleherald": "Chronicle Herald",
+    "stjohnstelegram": "The Telegram",
+}
+COLUMNS = {"media": "outlet", "newspaper": "outlet", "source": "outlet",
+           "published": "date", "pub_date": "date", "lang": "language",
+           "body": "text", "content": "text", "headline": "title"}
+SUFFIXES = (".jsonl", ".jsonl.gz", ".csv", ".csv.gz")
+UNKNOWN_LANGUAGE = "xx"                  # langue absente du dump (code ISO réservé)
+
+
+def _key(name: str) -> str:
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode()
+    name = re.sub(r"^the\s+", "", name.strip().lower())
+    name = name.replace("+", "plus").replace("&", "and")
+    return re.sub(r"[^a-z0-9]", "", name)
+
+
+_CANONICAL = {_key(o): o for o in OUTLETS} | ALIASES
+
+
+def normalize_outlet(name: str) -> str:
+    return _CANONICAL.get(_key(name), name.strip())
+
+
+ISO_DAY = r"^(\d{4}-\d{2}-\d{2})"
+
+
+def _local_day(value: str) -> pd.Timestamp:
+    ts = pd.to_datetime(value, errors="coerce")
+    if ts is pd.NaT:
+        return ts
+    return (ts.tz_localize(None) if ts.tzinfo else ts).normalize()
+
+
+def parse_dates(raw: pd.Series) -> pd.Series:
+    """Jour calendaire tel qu’écrit dans le dump (NaT si illisible).
+
+    Formats mélangés acceptés (AAAA-MM-JJ, horodatages ISO avec ou sans
+    fuseau, puis tout ce que pandas sait lire, ligne à ligne) ; pas de
+    conversion UTC : un article daté 23 h 30 à Montréal reste ce jour-là.
+    """
+    raw = raw.astype("string").str.strip()
+    date = pd.to_datetime(raw.str.extract(ISO_DAY, expand=False),
+                          format="%Y-%m-%d", errors="coerce")
+    rest = date.isna() & raw.notna()
+    if rest.any():                        # formats non ISO : rares, ligne à ligne
+        other = pd.Series([_local_day(v) for v in raw[rest]],
+                          index=raw.index[rest], dtype="datetime64[ns]")
+        date = date.mask(rest, other)
+    return date
+
+
+# ─────────────────── lecture par morceaux ─────────────────────────────
+def iter_chunks(path: Path) -> Iterator[pd.DataFrame]:
+    if path.name.endswith((".jsonl", ".jsonl.gz")):
+        reader = pd.read_json(path, lines=True, chunksize=CHUNK_ROWS,
+                              dtype=False, convert_dates=False)
+    else:
+        reader = pd.read_csv(path, chunksize=CHUNK_ROWS, dtype=str)
+    with reader:
+        yield from reader
+
+
+def normalize(df: pd.DataFrame, outlet: str) -> pd.DataFrame:
+    """Chunk brut → colonnes de app.data.corpus.SCHEMA (lignes sans date retirées)."""
+    df = df.rename(columns=COLUMNS)
+    for col in ("title", "text", "language", "id"):
+        if col not in df:
+            df[col] = None
+    outlets = (df["outlet"].fillna(outlet).map(normalize_outlet)
+               if "outlet" in df else pd.Series(outlet, index=df.index))
+
+    date = parse_dates(df["date"]) if "date" in df else pd.Series(pd.NaT, index=df.index)
+    keep = date.notna().to_numpy()
+    df, outlets, date = df[keep], outlets[keep], date[keep]
+
+    text = df["text"].fillna("").astype(str)
+    title = df["title"].fillna("").astype(str)
+    ids = df["id"].astype("string")
+    missing = ids.isna()
+    if missing.any():                     # id stable : hash média + date + titre
+        hashes = [hashlib.sha1(f"{o}|{d:%Y-%m-%d}|{t}".encode()).hexdigest()[:16]
+                  for o, d, t in zip(outlets[missing], date[missing], title[missing])]
+        ids = ids.mask(missing, pd.Series(hashes, index=ids.index[missing], dtype="string"))
+    return pd.DataFrame({
+        "id": ids.astype(str).to_numpy(),
+        "outlet": outlets.to_numpy(),
+        "year": date.dt.year.astype("int16").to_numpy(),
+        "month": date.dt.month.astype("int8").to_numpy(),
+        "date": date.dt.date.to_numpy(),
+        "language": (df["language"].astype("string").str.strip().str.lower()
+                     .str[:2].replace("", pd.NA).fillna(UNKNOWN_LANGUAGE).to_numpy()),
+        "n_words": text.str.count(r"\S+").astype("int32").to_numpy(),
+        "title": title.to_numpy(),
+        "text": text.to_numpy(),
+    })
+
+
+def raw_files(outlet_dir: Path) -> list[Path]:
+    return sorted(p for p in outlet_dir.rglob("*")
+                  if p.is_file() and p.name.endswith(SUFFIXES))
+
+
+def _rel(path: Path) -> str:
+    return path.relative_to(RAW_DIR).as_posix()
+
+
+def _fingerprint(path: Path) -> str:
+    st = path.stat()
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _batch(rel: str) -> str:
+    """Préfixe stable des fichiers Parquet issus d’un dump brut."""
+    return hashlib.sha1(rel.encode()).hexdigest()[:12]
+
+
+def _drop_parts(rel: str) -> None:
+    for fp in corpus.CORPUS_DIR.glob(f"*/*/part-{_batch(rel)}-*.parquet"):
+        fp.unlink()
+
+
+def ingest_files(outlet_dir: Path, files: list[Path]) -> tuple[str, dict, int]:
+    """Worker : (média, entrées de manifest par dump, lignes rejetées)."""
+    outlet = normalize_outlet(outlet_dir.name)
+    entries: dict[str, dict] = {}
+    dropped = 0
+    for path in files:
+        rel = _rel(path)
+        media: Counter = Counter()
+        month: Counter = Counter()
+        cells: Counter = Counter()
+        _drop_parts(rel)                  # restes d’un run interrompu
+        for c_idx, chunk in enumerate(iter_chunks(path)):
+            rows = normalize(chunk, outlet)
+            dropped += len(chunk) - len(rows)
+            if len(rows):
+                corpus.write(rows, batch=f"{_batch(rel)}-{c_idx}")
+                media.update({o: int(n) for o, n
+                              in rows.groupby("outlet").size().items()})
+                month.update({f"{y}-{m:02d}": int(n) for (y, m), n
+                              in rows.groupby(["year", "month"]).size().items()})
+                cells.update({cube.cell(*k): int(n) for k, n in rows.groupby(
+                    ["outlet", "year", "month", "language"]).size().items()})
+        entries[rel] = dict(fingerprint=_fingerprint(path), media=dict(media),
+                            month=dict(month), cube=dict(cells))
+    return outlet, entries, dropped
+
+
+# ─────────────────── manifest & agrégats ──────────────────────────────
+def load_manifest() -> dict[str, dict]:
+    return json.loads(MANIFEST.read_text()) if MANIFEST.exists() else {}
+
+
+def save_manifest(manifest: dict[str, dict]) -> None:
+    tmp = MANIFEST.with_suffix(".tmp")
+    tmp.write_text(json.dumps(manifest, indent=1, sort_keys=True))
+    os.replace(tmp, MANIFEST)
+
+
+def aggregates(manifest: dict[str, dict]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """(articles_by_media, articles_by_month) sommés depuis le manifest."""
+    media: Counter = Counter()
+    month: Counter = Counter()
+    for entry in manifest.values():
+        media.update(entry["media"])
+        month.update(entry["month"])
+    media_df = (pd.DataFrame(media.items(), columns=["media", "n_articles"])
+                  .sort_values(["n_articles", "media"], ascending=[False, True])
+                  .reset_index(drop=True))
+    ym = sorted(month)
+    month_df = pd.DataFrame({
+        "year": [int(k[:4]) for k in ym],
+        "month": [int(k[5:]) for k in ym],
+        "n_articles": [month[k] for k in ym],
+    })
+    return media_df, month_df
+
+
+def run(raw_dir: Path = RAW_DIR, workers: int = WORKERS, full: bool = False) -> int:
+    outlet_dirs = sorted(p for p in raw_dir.iterdir() if p.is_dir()) if raw_dir.is_dir() else []
+    if not outlet_dirs:
+        sys.exit(f"no raw dumps in {raw_dir} (expected {raw_dir}/<outlet>/*.jsonl)")
+    if full:
+        shutil.rmtree(corpus.CORPUS_DIR, ignore_errors=True)
+    corpus.CORPUS_DIR.mkdir(parents=True, exist_ok=True)
+    manifest = load_manifest()
+
+    # dumps supprimés ou modifiés : on retire leurs fichiers et leurs comptes
+    on_disk = {_rel(p): p for d in outlet_dirs for p in raw_files(d)}
+    removed = 0
+    for rel in list(manifest):
+        if rel not in on_disk or manifest[rel]["fingerprint"] != _fingerprint(on_disk[rel]):
+            _drop_parts(rel)
+            del manifest[rel]
+            removed += 1
+    todo: dict[Path, list[Path]] = {}
+    for rel, path in on_disk.items():
+        if rel not in manifest:
+            todo.setdefault(raw_dir / rel.split("/", 1)[0], []).append(path)
+
+    total = 0
+    if todo:
+        with ProcessPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+            jobs = [pool.submit(ingest_files, d, files) for d, files in todo.items()]
+            for job in as_completed(jobs):
+                outlet, entries, dropped = job.result()
+                written = sum(sum(e["media"].values()) for e in entries.values())
+                total += written
+                manifest.update(entries)
+                save_manifest(manifest)   # reprise possible après interruption
+                print(f"  {outlet}: {written} new articles"
+                      + (f" ({dropped} rows without a valid date)" if dropped else ""))
+    save_manifest(manifest)
+    corpus.export_aggregates(*aggregates(manifest))
+    # métadonnées mmap : ré-écrites seulement si une partition a changé
+    if todo or removed or not corpus.META_FILE.exists():
+        corpus.VERSION_FILE.touch()
+        corpus.export_meta()
+    cube.build(manifest)
+    return total
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    n = run(full=os.environ.get("FULL", "") not in ("", "0"))
+    print(f"{n} articles ingested in {time.perf_counter() - t0:.1f}s → {corpus.CORPUS_DIR}")
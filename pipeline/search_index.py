@@ -0,0 +1,77 @@
+"""
+Search index – `make index`
+---------------------------
+• index plein texte SQLite FTS5 (titre + texte) construit depuis le corpus
+  Parquet par lots : jamais plus d’un lot de textes en mémoire
+• table articles (rowid = rowid FTS) pour les filtres média / date
+• écrit dans un fichier temporaire puis remplace atomiquement SEARCH_DB
+"""
+from __future__ import annotations
+
+import os
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from app.data import corpus  # noqa: E402
+from app.data.search import SEARCH_DB  # noqa: E402
+
+BATCH_ROWS = 5_000
+
+_DDL = """
+CREATE TABLE articles(
+    rowid  INTEGER PRIMARY KEY,
+    id     TEXT NOT NULL,
+    outlet TEXT NOT NULL,
+    day    TEXT NOT NULL,            -- AAAA-MM-JJ, comparable en texte
+    title  TEXT
+);
+CREATE VIRTUAL TABLE fts USING fts5(
+    title, text,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def build(dst: Path = SEARCH_DB) -> int:
+    tmp = dst.with_name(f"{dst.name}.{os.getpid()}.tmp")
+    tmp.unlink(missing_ok=True)
+    con = sqlite3.connect(tmp)
+    con.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;" + _DDL)
+
+    rowid = 0
+    scanner = corpus.dataset().scanner(
+        columns=["id", "outlet", "date", "title", "text"], batch_size=BATCH_ROWS)
+    for batch in scanner.to_batches():
+        cols = batch.to_pydict()
+        rows = range(rowid + 1, rowid + 1 + batch.num_rows)
+        with con:
+            con.executemany(
+                "INSERT INTO articles VALUES (?, ?, ?, ?, ?)",
+                zip(rows, cols["id"], cols["outlet"],
+                    (d.isoformat() for d in cols["date"]), cols["title"]))
+            con.executemany(
+                "INSERT INTO fts(rowid, title, text) VALUES (?, ?, ?)",
+                zip(rows, cols["title"], cols["text"]))
+        rowid += batch.num_rows
+
+    con.executescript("""
+        CREATE INDEX articles_outlet_day ON articles(outlet, day);
+        CREATE INDEX articles_day ON articles(day);
+        INSERT INTO fts(fts) VALUES ('optimize');
+        ANALYZE;
+    """)
+    con.close()
+    os.replace(tmp, dst)
+    return rowid
+
+
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    n = build()
+    print(f"{n} articles indexed in {time.perf_counter() - t0:.1f}s → {SEARCH_DB}")
@@ -0,0 +1,7 @@
+"""Racine du dépôt dans sys.path : `python -m pytest` ou `pytest` depuis n’importe où."""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
@@ -0,0 +1,109 @@
+"""app.data.analysis / pipeline.analysis – cellules, parts, jointure."""
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.data import analysis as analysis_mod
+from app.data import corpus
+from app.data.analysis import Scores
+from pipeline import analysis as build_mod
+
+# deux médias × trois mois (2020-01 … 2020-03), deux cadres
+OUTLETS = ["Le Devoir", "Toronto Star"]
+ROWS = [  # (média, mois, p(eco), p(health))
+    (0, 0, 1.0, 0.0), (0, 0, 0.0, 1.0),
+    (0, 2, 0.5, 0.5),
+    (1, 1, 1.0, 0.0), (1, 1, 1.0, 0.0), (1, 1, 0.0, 0.0),
+]
+
+
+@pytest.fixture
+def scores() -> Scores:
+    cells = np.array([o * 3 + m for o, m, *_ in ROWS])
+    matrix = np.array([r[2:] for r in ROWS], dtype=np.float32)
+    matrix = matrix[np.argsort(cells, kind="stable")]
+    offsets = np.r_[0, np.cumsum(np.bincount(cells, minlength=6))]
+    dims = dict(labels=["eco", "health"], outlets=OUTLETS,
+                first_month=(2020 - 1970) * 12, n_months=3)
+    return Scores(matrix, offsets, dims, "test")
+
+
+def test_cells_sums_and_counts(scores):
+    sums, counts = scores.cells()
+    assert counts.tolist() == [[2, 0, 1], [0, 3, 0]]
+    np.testing.assert_allclose(sums[0, 0], [1, 1])
+    np.testing.assert_allclose(sums[1, 1], [2, 0])
+    np.testing.assert_allclose(sums[0, 1], [0, 0])   # cellule vide
+
+
+def test_frame_by_outlet_monthly(scores):
+    df = scores.frame("outlet", "eco", granularity="month")
+    assert df["label"].tolist() == ["2020‑01", "2020‑02", "2020‑03"]
+    assert df["Le Devoir"].tolist()[::2] == [50.0, 50.0]
+    assert np.isnan(df["Le Devoir"].iloc[1])           # aucun article
+    assert df["Toronto Star"].iloc[1] == pytest.approx(66.67)
+
+
+def test_frame_by_label_yearly_pools_outlets(scores):
+    df = scores.frame("label", granularity="year")
+    assert df["label"].tolist() == ["2020"]
+    assert df["eco"].iloc[0] == pytest.approx(100 * 3.5 / 6, abs=.01)
+    assert df["health"].iloc[0] == pytest.approx(100 * 1.5 / 6, abs=.01)
+
+
+def test_frame_by_region_and_years(scores):
+    df = scores.frame("region", "eco", years=(2020, 2020), granularity="quarter")
+    assert set(df.columns) == {"year_month", "label", "Quebec", "Ontario"}
+    assert df["label"].tolist() == ["2020 Q1"]
+    assert scores.frame("outlet", years=(2021, 2022)).empty
+
+
+def test_frame_rejects_unknown_grouping(scores):
+    with pytest.raises(ValueError):
+        scores.frame("planet")
+
+
+def test_overall(scores):
+    share = scores.overall(["Toronto Star"])
+    assert share.to_dict() == {"eco": pytest.approx(66.67), "health": 0.0}
+
+
+# ─────────────────── build : jointure sur (id, média, année) ──────────
+@pytest.fixture
+def tiny_corpus(tmp_path, monkeypatch):
+    monkeypatch.setattr(corpus, "CORPUS_DIR", tmp_path / "articles")
+    monkeypatch.setattr(corpus, "VERSION_FILE", tmp_path / "articles/_version")
+    monkeypatch.setattr(corpus, "META_FILE", tmp_path / "meta.arrow")
+    monkeypatch.setattr(corpus, "_dataset", (-1, None))
+    monkeypatch.setattr(analysis_mod, "ANALYSIS_DIR", tmp_path / "analysis")
+    monkeypatch.setattr(build_mod, "ANALYSIS_DIR", tmp_path / "analysis")
+    corpus.CORPUS_DIR.mkdir()
+    # même id « 1 » dans deux médias et deux années
+    rows = pd.DataFrame(dict(
+        id=["1", "2", "1", "1"], outlet=["A", "A", "B", "A"],
+        year=[2020, 2020, 2020, 2021], month=[1, 1, 2, 3],
+        date=[dt.date(2020, 1, 1)] * 4, language="en", n_words=1,
+        title="t", text="x"))
+    corpus.write(rows)
+    notes = tmp_path / "annotations"
+    for (outlet, year), ids, eco in [(("A", 2020), ["1", "2"], [1.0, 0.0]),
+                                     (("B", 2020), ["1"], [0.0]),
+                                     (("A", 2021), ["1"], [1.0])]:
+        part = notes / f"outlet={outlet}" / f"year={year}"
+        part.mkdir(parents=True)
+        pq.write_table(pa.table({"id": ids, "eco": pa.array(eco, pa.float32())}),
+                       part / "part-0.parquet")
+    return notes
+
+
+def test_build_does_not_duplicate_colliding_ids(tiny_corpus):
+    assert build_mod.build(tiny_corpus) == (4, 1)
+    scores = analysis_mod.load_scores()
+    assert scores.outlets == ["A", "B"]
+    sums, counts = scores.cells()
+    assert counts.sum() == 4
+    assert sums[..., 0].sum() == 2.0
@@ -0,0 +1,67 @@
+"""pipeline.annotate – classifieur de référence, reprise sur checkpoint."""
+import datetime as dt
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data import analysis as analysis_mod
+from app.data import corpus
+from pipeline import analysis as build_mod
+from pipeline import annotate
+
+
+def test_lexicon_classifier_scores():
+    model = annotate.LexiconClassifier()
+    probs = model.predict(["Flood warning", None], ["", "la santé publique et les hôpitaux"])
+    assert probs.shape == (2, len(model.labels)) and probs.dtype == np.float32
+    assert probs[0, model.labels.index("disaster")] > 0.5
+    assert probs[1, model.labels.index("health")] > 0
+    assert probs[1, model.labels.index("disaster")] == 0
+    assert model.version == annotate.LexiconClassifier().version
+
+
+def _rows(outlet, year, n, batch):
+    return pd.DataFrame(dict(
+        id=[f"{batch}{i}" for i in range(n)], outlet=outlet, year=year, month=1,
+        date=dt.date(year, 1, 1), language="en", n_words=2,
+        title="storm", text="tempête"))
+
+
+@pytest.fixture
+def setup(tmp_path, monkeypatch):
+    monkeypatch.setattr(corpus, "CORPUS_DIR", tmp_path / "articles")
+    monkeypatch.setattr(corpus, "VERSION_FILE", tmp_path / "articles/_version")
+    monkeypatch.setattr(corpus, "META_FILE", tmp_path / "meta.arrow")
+    monkeypatch.setattr(corpus, "_dataset", (-1, None))
+    monkeypatch.setattr(annotate, "OUT_DIR", tmp_path / "annotations")
+    monkeypatch.setattr(annotate, "CHECKPOINT", tmp_path / "annotations/_checkpoint.json")
+    monkeypatch.setattr(analysis_mod, "ANALYSIS_DIR", tmp_path / "analysis")
+    monkeypatch.setattr(build_mod, "ANALYSIS_DIR", tmp_path / "analysis")
+    corpus.CORPUS_DIR.mkdir()
+    corpus.write(_rows("A", 2020, 3, "a"), batch="a")
+    corpus.write(_rows("B", 2021, 2, "b"), batch="b")
+
+
+def test_resume_only_redoes_what_changed(setup):
+    first = annotate.run(workers=1)
+    assert (first["partitions"], first["articles"]) == (2, 5)
+    assert set(annotate.load_checkpoint()) == {"A/2020", "B/2021"}
+    assert first["matrix"] == (5, len(annotate.FRAMES))
+
+    pointer = analysis_mod.ANALYSIS_DIR / "CURRENT"
+    published = pointer.read_text()
+    idle = annotate.run(workers=1)                             # rien de neuf
+    assert idle["partitions"] == 0 and "matrix" not in idle
+    assert pointer.read_text() == published                    # rien republié
+
+    corpus.write(_rows("A", 2020, 1, "x"), batch="x")          # partition modifiée
+    again = annotate.run(workers=1)
+    assert (again["partitions"], again["articles"]) == (1, 4)
+
+    done = annotate.load_checkpoint()                          # run interrompu
+    del done["B/2021"]
+    done["A/2020"]["model"] = "older-model"                    # autre classifieur
+    annotate.save_checkpoint(done)
+    assert annotate.run(workers=1)["partitions"] == 2
+    assert analysis_mod.load_scores().cells()[1].sum() == 6
@@ -0,0 +1,111 @@
+"""app.components.assets – LRU en octets, mtime, variantes, URL hachées."""
+import json
+import os
+import time
+
+import pytest
+from PIL import Image
+
+from app.components import assets
+from pipeline import images
+
+
+@pytest.fixture
+def tree(tmp_path, monkeypatch):
+    static = tmp_path / "static"
+    root = static / "assets"
+    for mod in (assets, images):
+        monkeypatch.setattr(mod, "ASSETS_DIR", root)
+        monkeypatch.setattr(mod, "GENERATED_DIR", root / "generated")
+        monkeypatch.setattr(mod, "HASHED_DIR", root / "hashed")
+        monkeypatch.setattr(mod, "MANIFEST", root / "generated/manifest.json")
+    monkeypatch.setattr(assets, "STATIC_DIR", static)
+    monkeypatch.setattr(assets, "_CACHE", assets._LRUCache(assets.BUDGET_BYTES))
+    monkeypatch.setattr(assets, "_manifest", (0, {}))
+    monkeypatch.setattr(assets, "_digests", {})
+    monkeypatch.setattr(assets, "FORMATS", ("webp",))
+    (root / "generated").mkdir(parents=True)
+    return root
+
+
+def _manifest(root, rel, size, variants):
+    """Manifest minimal : une source *rel* et des variantes (w, h, octets)."""
+    (root / rel).parent.mkdir(parents=True, exist_ok=True)
+    (root / rel).write_bytes(b"s" * size)
+    entries = []
+    for w, h, n in variants:
+        path = f"generated/{w}x{h}.webp"
+        (root / path).write_bytes(b"v" * n)
+        entries.append(dict(path=path, format="webp", width=w, height=h, bytes=n))
+    (root / "generated/manifest.json").write_text(
+        json.dumps(dict(version=2, sources={rel: dict(variants=entries)})))
+    return root / rel
+
+
+def test_lru_keeps_within_byte_budget():
+    cache = assets._LRUCache(budget=10)
+    cache.put(("a", 1), "aaaa")
+    cache.put(("b", 1), "bbbb")
+    assert cache.get(("a", 1)) == "aaaa"         # « a » devient le plus récent
+    cache.put(("c", 1), "cccc")
+    assert cache.get(("b", 1)) is None           # le moins récent part
+    assert cache.stats()["bytes"] == 8 <= cache.budget
+    cache.put(("big", 1), "x" * 11)              # plus gros que le budget
+    assert cache.get(("big", 1)) is None and cache.stats()["entries"] == 2
+
+
+def test_data_uri_is_invalidated_by_mtime(tree):
+    fp = tree / "logo.png"
+    fp.write_bytes(b"one")
+    first = assets.data_uri(fp)
+    assert first.startswith("data:image/png;base64,")
+    assert assets.data_uri(fp) is first          # servi par le cache
+    fp.write_bytes(b"two")
+    os.utime(fp, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert assets.data_uri(fp) != first
+    assert assets.cache_stats()["entries"] == 1  # l’ancienne version est retirée
+    assert assets.data_uri(tree / "missing.png") is None
+
+
+def test_variant_picks_smallest_covering_and_lighter_than_source(tree):
+    src = _manifest(tree, "media/logo.png", 1000,
+                    [(128, 64, 300), (256, 128, 900), (512, 256, 1500)])
+    assert assets.variant(src, width=40).name == "128x64.webp"    # 80 px requis
+    assert assets.variant(src, width=100).name == "256x128.webp"
+    assert assets.variant(src, width=200) == src    # 512 px plus lourde que l’original
+    assert assets.variant(src, height=200) == src   # aucune assez haute
+    assert assets.variant(src) == src               # taille inconnue
+
+
+def test_static_url_only_looks_up_prebuilt_copies(tree):
+    fp = tree / "team photo.JPG"
+    fp.write_bytes(b"photo")
+    assert assets.static_url(fp) is None
+    assert not (tree / "hashed").exists()           # rien écrit à l’exécution
+
+    digest = images._sha256(fp)
+    (tree / "hashed").mkdir()
+    (tree / "hashed" / assets.hashed_name(fp, digest)).write_bytes(b"photo")
+    assert assets.static_url(fp) == f"app/static/assets/hashed/team_photo.{digest[:12]}.jpg"
+
+
+def test_url_mode_falls_back_to_data_uri(tree, monkeypatch):
+    monkeypatch.setattr(assets, "ASSET_MODE", "url")
+    fp = tree / "icon.png"
+    fp.write_bytes(b"icon")
+    assert assets.image_src(fp).startswith("data:image/png;base64,")
+
+
+def test_make_assets_builds_banner_variants_and_hashed_copies(tree):
+    (tree / "media").mkdir()
+    Image.new("RGB", (1200, 150), "white").save(tree / "media/wide.png")
+    manifest = images.build()
+    variants = manifest["sources"]["media/wide.png"]["variants"]
+    assert any(v["height"] == 60 * assets.DPR for v in variants)
+    hashed = {fp.name for fp in (tree / "hashed").iterdir()}
+    assert len(hashed) == len(variants) + 1          # source + variantes
+    assert assets.static_url(tree / "media/wide.png") is not None
+
+    (tree / "media/wide.png").unlink()
+    images.build()
+    assert not any((tree / "hashed").iterdir())      # copies orphelines supprimées
@@ -0,0 +1,71 @@
+"""app.data.cache – clés, invalidation, LRU disque."""
+import os
+import time
+
+import pytest
+
+from app.data import cache
+
+
+@pytest.fixture(autouse=True)
+def tmp_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache, "_memory", cache.OrderedDict())
+
+
+def test_key_is_stable_and_sensitive_to_every_part():
+    k = cache.key("corpus.query", "fp1", "code1", (["outlet"],))
+    assert k == cache.key("corpus.query", "fp1", "code1", (["outlet"],))
+    assert k.startswith("corpus.query-")
+    others = {cache.key("corpus.query", "fp2", "code1", (["outlet"],)),
+              cache.key("corpus.query", "fp1", "code2", (["outlet"],)),
+              cache.key("corpus.query", "fp1", "code1", (["year"],)),
+              cache.key("echarts", "fp1", "code1", (["outlet"],))}
+    assert k not in others and len(others) == 4
+
+
+def test_code_version_follows_source(tmp_path):
+    src = tmp_path / "mod.py"
+    src.write_text("x = 1\n")
+    v1 = cache.code_version(src)
+    src.write_text("x = 2\n")
+    os.utime(src, ns=(time.time_ns(), time.time_ns() + 10**9))
+    assert cache.code_version(src) != v1
+
+
+def test_get_put_roundtrip_and_miss():
+    assert cache.get("nope") is cache.MISS
+    cache.put("k", {"a": [1, 2]})
+    cache._memory.clear()                       # relu depuis le disque
+    assert cache.get("k") == {"a": [1, 2]}
+
+
+def test_cached_invalidates_on_inputs():
+    calls = []
+    fingerprint = {"v": "a"}
+
+    @cache.cached("t.double", inputs=lambda: fingerprint["v"])
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    assert double(3) == 6 and double(3) == 6
+    assert calls == [3]
+    fingerprint["v"] = "b"                      # nouvelle ingestion
+    assert double(3) == 6
+    assert calls == [3, 3]
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    for i, name in enumerate("abc"):
+        cache.put(name, b"x" * 1000)
+        os.utime(tmp_path / f"{name}.pkl", ns=(i * 10**9, i * 10**9))
+    cache._memory.clear()
+    cache.get("a")                              # a redevient le plus récent
+    assert cache.evict(max_bytes=2500) == 1
+    assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == ["a", "c"]
+
+
+def test_corrupt_entry_is_a_miss(tmp_path):
+    (tmp_path / "bad.pkl").write_bytes(b"not a pickle")
+    assert cache.get("bad") is cache.MISS
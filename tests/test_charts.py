@@ -0,0 +1,60 @@
+"""app.components.charts – encodage des séries pour le composant ECharts."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.components import charts
+from app.data.resample import resample_months
+
+
+def _series(months: list[int]) -> pd.DataFrame:
+    ym = np.array(months).astype("datetime64[M]").astype("datetime64[ns]")
+    df = pd.DataFrame({"year_month": ym, "label": [str(m) for m in months],
+                       "n_articles": np.arange(len(months)) * 1.5})
+    df.attrs["granularity"] = "month"
+    return df
+
+
+def test_regular_axis_is_start_and_step():
+    axis, buffers = charts._axis(_series([600, 603, 606]))
+    assert axis == dict(granularity="month", n=3, start=600, step=3)
+    assert buffers == {}
+
+
+def test_irregular_axis_ships_int32_months():
+    axis, buffers = charts._axis(_series([600, 601, 650]))
+    assert "start" not in axis
+    assert np.frombuffer(buffers["x"], "<i4").tolist() == [600, 601, 650]
+
+
+def test_encode_time_and_compare():
+    args, buffers = charts.encode("time", _series([600, 601]))
+    assert args["kind"] == "line" and args["names"] == ["Articles"]
+    assert np.frombuffer(buffers["s0"], "<f4").tolist() == [0.0, 1.5]
+
+    raw = pd.DataFrame({"year": [2020, 2020], "month": [1, 2],
+                        "A": [1, 2], "B": [3, np.nan]})
+    df = resample_months(raw.fillna(0))
+    args, buffers = charts.encode("stacked", df)
+    assert args["names"] == ["A", "B"] and args["stack"] is True
+    assert np.frombuffer(buffers["s1"], "<f4").tolist() == [3.0, 0.0]
+
+
+def test_encode_media_bars():
+    df = pd.DataFrame({"media": ["A", "B"], "n_articles": [5, 2]})
+    args, buffers = charts.encode("media", df)
+    assert args["categories"] == ["A", "B"]
+    assert np.frombuffer(buffers["s0"], "<f4").tolist() == [5.0, 2.0]
+
+
+def test_encode_rejects_unknown_view():
+    with pytest.raises(ValueError):
+        charts.encode("pie", _series([600]))
+
+
+def test_data_version_is_content_hash_when_missing():
+    a, b = _series([600, 601]), _series([600, 601])
+    assert charts.data_version(a) == charts.data_version(b)
+    b["n_articles"] = [9.0, 9.0]
+    b.attrs.pop("version")
+    assert charts.data_version(a) != charts.data_version(b)
@@ -0,0 +1,70 @@
+"""app.data.cube / pipeline.cube – tranches, totaux, build depuis le manifest."""
+import numpy as np
+import pytest
+
+from app.data import cube as cube_mod
+from app.data import snapshot
+from app.data.cube import Cube
+from pipeline import cube as build_mod
+
+DIMS = dict(outlets=["A", "B", "C"], languages=["en", "fr"], first_month=600)
+
+
+@pytest.fixture
+def cube() -> Cube:
+    counts = np.arange(3 * 4 * 2, dtype=np.int32).reshape(3, 4, 2)
+    return Cube(counts, DIMS, "test")
+
+
+def test_slice_defaults_to_everything(cube):
+    np.testing.assert_array_equal(cube.slice(), cube.counts.sum(axis=2))
+
+
+def test_slice_selects_outlets_in_order_and_languages(cube):
+    got = cube.slice(["C", "A"], ["fr"])
+    np.testing.assert_array_equal(got, cube.counts[[2, 0], :, 1])
+
+
+def test_total_sums_outlets(cube):
+    np.testing.assert_array_equal(cube.total(["A", "B"]),
+                                  cube.counts[:2].sum(axis=(0, 2)))
+    assert cube.total().sum() == cube.counts.sum()
+
+
+def test_unknown_outlet_raises(cube):
+    with pytest.raises(KeyError):
+        cube.slice(["Nope"])
+
+
+def test_months_axis_and_frame(cube):
+    assert str(cube.months[0]) == "2020-01"
+    df = cube.frame(["B"], ["en"])
+    assert df[["year", "month"]].iloc[-1].tolist() == [2020, 4]
+    assert df["B"].tolist() == cube.counts[1, :, 0].tolist()
+    assert "B" in df.attrs["version"]
+
+
+def test_from_manifest_sums_dumps():
+    manifest = {
+        "A/1.jsonl": dict(cube={"A|2020-01|en": 2, "A|2020-03|fr": 1}),
+        "A/2.jsonl": dict(cube={"A|2020-01|en": 3}),
+        "B/1.jsonl": dict(cube={"B|2019-12|en": 4}),
+    }
+    df = build_mod.from_manifest(manifest).sort_values(["outlet", "year", "month"])
+    assert df.values.tolist() == [["A", 2020, 1, "en", 5], ["A", 2020, 3, "fr", 1],
+                                  ["B", 2019, 12, "en", 4]]
+    assert build_mod.from_manifest({"x": dict(media={})}) is None
+
+
+def test_build_publishes_a_loadable_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(build_mod, "CUBE_DIR", tmp_path)
+    monkeypatch.setattr(cube_mod, "CUBE_DIR", tmp_path)
+    manifest = {"d": dict(cube={"A|2020-01|en": 2, "B|2020-03|fr": 5})}
+    assert build_mod.build(manifest) == (2, 3, 2)
+    loaded = cube_mod.load_cube()
+    assert loaded.total().tolist() == [2, 0, 5]
+
+    manifest["e"] = dict(cube={"C|2020-02|en": 1})
+    build_mod.build(manifest)
+    assert cube_mod.load_cube().outlets == ["A", "B", "C"]
+    assert len([p for p in tmp_path.iterdir() if p.is_dir()]) <= snapshot.KEEP
@@ -0,0 +1,74 @@
+"""pipeline.ingest – normalisation d’un chunk brut (dates, médias, ids)."""
+import pandas as pd
+import pytest
+
+from pipeline.ingest import UNKNOWN_LANGUAGE, normalize, normalize_outlet, parse_dates
+
+
+def _chunk(**cols) -> pd.DataFrame:
+    n = len(next(iter(cols.values())))
+    base = dict(title=[f"t{i}" for i in range(n)], text=["a b c"] * n)
+    return pd.DataFrame(base | cols)
+
+
+def test_mixed_date_formats_are_all_kept():
+    raw = pd.Series(["2020-01-05", "2021-03-04T10:00:00", "2019-06-01T10:00:00Z",
+                     "2018-02-03 08:15", "Jan 3, 2017"])
+    days = parse_dates(raw)
+    assert days.notna().all()
+    assert [d.strftime("%Y-%m-%d") for d in days] == [
+        "2020-01-05", "2021-03-04", "2019-06-01", "2018-02-03", "2017-01-03"]
+
+
+def test_local_day_is_not_shifted_to_utc():
+    days = parse_dates(pd.Series(["2021-12-31T23:30:00-05:00",
+                                  "2022-01-01T00:30:00+01:00"]))
+    assert [(d.year, d.month, d.day) for d in days] == [(2021, 12, 31), (2022, 1, 1)]
+
+
+def test_unreadable_dates_are_dropped():
+    rows = normalize(_chunk(date=["2020-01-05", "garbage", None, ""]), "Le Devoir")
+    assert len(rows) == 1
+    assert (rows["year"].tolist(), rows["month"].tolist()) == ([2020], [1])
+
+
+@pytest.mark.parametrize("raw, expected", [
+    ("The Globe and Mail", "Globe and Mail"),
+    ("globe & mail", "Globe and Mail"),
+    ("LA PRESSE+", "La Presse Plus"),
+    ("Journal de Montréal", "Journal de Montreal"),
+    ("Saskatoon StarPhoenix", "Star Phoenix"),
+    ("  Unknown Weekly ", "Unknown Weekly"),
+])
+def test_outlet_aliases(raw, expected):
+    assert normalize_outlet(raw) == expected
+
+
+def test_outlet_column_falls_back_to_folder_name():
+    rows = normalize(_chunk(date=["2020-01-01"] * 2, newspaper=["Gazette", None]),
+                     "Toronto Star")
+    assert rows["outlet"].tolist() == ["Montreal Gazette", "Toronto Star"]
+
+
+def test_missing_ids_get_a_stable_hash():
+    chunk = _chunk(date=["2020-01-01", "2020-01-02", "2020-01-03"],
+                   id=["a1", None, None])
+    first = normalize(chunk, "Le Devoir")["id"].tolist()
+    assert first[0] == "a1"
+    assert all(isinstance(i, str) and len(i) == 16 for i in first[1:])
+    assert first[1] != first[2]
+    assert normalize(chunk, "Le Devoir")["id"].tolist() == first
+
+
+def test_no_id_column_at_all():
+    rows = normalize(_chunk(date=["2020-01-01", "2020-01-01"]), "Le Devoir")
+    assert rows["id"].str.len().eq(16).all()
+    assert rows["id"].nunique() == 2           # titres différents
+
+
+def test_language_codes_and_missing_language():
+    rows = normalize(_chunk(date=["2020-01-01"] * 4,
+                            language=["EN", "fr-CA", None, " "]), "Le Devoir")
+    assert rows["language"].tolist() == ["en", "fr", UNKNOWN_LANGUAGE, UNKNOWN_LANGUAGE]
+    no_column = normalize(_chunk(date=["2020-01-01"]), "Le Devoir")
+    assert no_column["language"].tolist() == [UNKNOWN_LANGUAGE]
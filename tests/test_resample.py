@@ -0,0 +1,88 @@
+"""app.data.resample – LTTB, agrégation, série réduite et son cache."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.data import resample
+from app.data.resample import aggregate, lttb, resample_months
+
+
+def _months(n: int, start: int = 1978, cols: int = 1) -> pd.DataFrame:
+    m = np.arange(n)
+    df = pd.DataFrame({"year": start + m // 12, "month": m % 12 + 1})
+    for c in range(cols):
+        df[f"s{c}"] = (m * (c + 1)) % 17
+    return df
+
+
+def test_lttb_keeps_ends_and_count():
+    x = np.arange(1000)
+    y = np.sin(x / 20)
+    idx = lttb(x, y, 50)
+    assert len(idx) == 50
+    assert idx[0] == 0 and idx[-1] == 999
+    assert (np.diff(idx) > 0).all()
+
+
+def test_lttb_keeps_a_spike():
+    y = np.zeros(500)
+    y[321] = 100
+    assert 321 in lttb(np.arange(500), y, 20)
+
+
+@pytest.mark.parametrize("n, n_out", [(10, 20), (10, 10), (10, 2), (0, 5)])
+def test_lttb_no_reduction(n, n_out):
+    assert lttb(np.arange(n), np.arange(n), n_out).tolist() == list(range(n))
+
+
+def test_aggregate_month_labels_and_types():
+    out = aggregate(_months(3))
+    assert out["label"].tolist() == ["1978‑01", "1978‑02", "1978‑03"]
+    assert out["s0"].dtype == np.int64
+    assert out.attrs["granularity"] == "month"
+
+
+def test_aggregate_quarter_and_year_sum_every_column():
+    df = _months(24, cols=2)
+    q = aggregate(df, "quarter")
+    assert q["label"].tolist()[:2] == ["1978 Q1", "1978 Q2"]
+    assert q["s1"].sum() == df["s1"].sum()
+    y = aggregate(df, "year")
+    assert y["label"].tolist() == ["1978", "1979"]
+    assert y["s0"].tolist() == [df["s0"][:12].sum(), df["s0"][12:].sum()]
+    assert str(y["year_month"].iloc[1].date()) == "1979-01-01"
+
+
+def test_aggregate_unordered_input():
+    df = _months(5).iloc[::-1]
+    assert aggregate(df)["s0"].tolist() == _months(5)["s0"].tolist()
+
+
+def test_aggregate_rejects_unknown_granularity():
+    with pytest.raises(ValueError):
+        aggregate(_months(3), "week")
+
+
+def test_resample_caps_points_and_keeps_columns():
+    df = _months(600, cols=3)
+    out = resample_months(df, "month", max_points=100)
+    assert len(out) == 100
+    assert list(out.columns) == ["year_month", "label", "s0", "s1", "s2"]
+    assert out["year_month"].is_monotonic_increasing
+
+
+def test_resample_cache_is_bounded_lru(monkeypatch):
+    monkeypatch.setattr(resample, "CACHE_ENTRIES", 3)
+    monkeypatch.setattr(resample, "_CACHE", resample.OrderedDict())
+    frames = []
+    for i in range(5):
+        df = _months(24)
+        df.attrs["version"] = f"cube@1|outlets-{i}"
+        frames.append(df)
+        resample_months(df, "year")
+    assert len(resample._CACHE) == 3
+    first = resample_months(frames[2], "year")
+    assert resample_months(frames[2], "year") is first          # hit
+    resample_months(frames[0], "year")                           # évince le plus ancien
+    assert ("cube@1|outlets-3", "year", resample.MAX_POINTS) not in resample._CACHE
+    assert ("cube@1|outlets-2", "year", resample.MAX_POINTS) in resample._CACHE